@@ -8,14 +8,202 @@ import yaml
 import json
 import sys
 import os
-from typing import Dict, List, Any
+import hashlib
+import mmap
+import string
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Any,
+    BinaryIO,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+from urllib.parse import urlsplit
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Prefer the LibYAML-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _BaseDumper
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _BaseDumper
+
+
+class _SafeDumper(_BaseDumper):
+    """Safe dumper that writes shared objects inline instead of as anchors."""
+
+    def ignore_aliases(self, data: Any) -> bool:
+        return True
+
+
+def _dump_yaml(obj: Any, stream: Optional[BinaryIO] = None) -> Optional[bytes]:
+    """Dump obj as UTF-8 block-style YAML to stream, or return it as bytes."""
+    return yaml.dump(
+        obj,
+        stream,
+        Dumper=_SafeDumper,
+        default_flow_style=False,
+        sort_keys=False,
+        encoding="utf-8",
+    )
+
+
+# ASCII upper -> lower and space -> underscore, applied in one str.translate pass
+_SLUG_TABLE = {ord(c): ord(c.lower()) for c in string.ascii_uppercase}
+_SLUG_TABLE[ord(" ")] = ord("_")
+
+# Timing and path shared by every direct /metrics scrape job
+_SCRAPE_DEFAULTS = {
+    "scrape_interval": "15s",
+    "metrics_path": "/metrics",
+    "scrape_timeout": "10s",
+}
+
+# Blackbox probe module parameters and relabel rules shared by every bridge
+# probe job (never mutated)
+_PROBE_PARAMS = {"module": ["http_2xx"]}
+_RELABEL_SOURCE = {"source_labels": ["__address__"], "target_label": "__param_target"}
+_RELABEL_BLACKBOX = {
+    "target_label": "__address__",
+    "replacement": "${BLACKBOX_EXPORTER_ADDRESS}",
+}
+
+# Fixed part of prometheus.yml; generate_prometheus_config appends the
+# generated scrape jobs after the prometheus self-scrape job
+_PROMETHEUS_BASE = {
+    "global": {
+        "scrape_interval": "15s",
+        "evaluation_interval": "15s",
+        "external_labels": {"cluster": "sui-monitoring", "replica": "prometheus-1"},
+    },
+    "rule_files": ["/etc/prometheus/rules/*.yml"],
+    "alerting": {
+        "alertmanagers": [
+            {"static_configs": [{"targets": ["${ALERTMANAGER_TARGET}"]}]}
+        ]
+    },
+    "scrape_configs": [
+        {
+            "job_name": "prometheus",
+            "static_configs": [{"targets": ["${PROMETHEUS_TARGET}"]}],
+            "scrape_interval": "5s",
+            "metrics_path": "/metrics",
+        }
+    ],
+}
+
+# Rendered once; scrape_configs is the last key, so generated jobs dumped as a
+# sequence can be appended to it directly
+_PROMETHEUS_BASE_YAML = _dump_yaml(_PROMETHEUS_BASE)
+
+# Fields every configured entity must define with a non-empty value
+BRIDGE_REQUIRED_FIELDS = ("alias", "target", "public_address")
+VALIDATOR_REQUIRED_FIELDS = ("alias", "target")
+FULLNODE_REQUIRED_FIELDS = ("alias", "target")
+
+# Set to "1" to write prometheus.yml and the alert rule files as JSON (valid
+# YAML) instead of block YAML
+PROMETHEUS_JSON_ENV = "SUI_TOOLS_PROMETHEUS_JSON"
+
+# Write buffer for generated YAML files, large enough that each file is
+# flushed with a single write
+YAML_WRITE_BUFFER_SIZE = 1 << 20
+
+# Sidecar suffix recording the input digest a generated file was built from
+DIGEST_SUFFIX = ".blake2b"
+
+
+# Reusable stdlib encoder; config data is tree-shaped, so skip circular checks
+_json_encoder = json.JSONEncoder(indent=2, ensure_ascii=False, check_circular=False)
+_json_encode = _json_encoder.encode
+
+
+def _dumps_json(obj: Any) -> bytes:
+    """Serialize obj as 2-space indented JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return _json_encode(obj).encode("utf-8")
+
+
+def _write_json(obj: Any, path: str) -> None:
+    """Write obj to path as JSON, streaming chunks when orjson is unavailable."""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        for chunk in _json_encoder.iterencode(obj):
+            f.write(chunk)
+
+
+def _write_yaml(obj: Any, path: str) -> None:
+    """Write obj to path as block-style YAML in a single buffered write."""
+    with open(path, "wb", buffering=YAML_WRITE_BUFFER_SIZE) as f:
+        _dump_yaml(obj, f)
+
+
+def _json_output() -> bool:
+    """Whether files read by Prometheus should be written as JSON."""
+    return os.environ.get(PROMETHEUS_JSON_ENV) == "1"
+
+
+def _load_yaml(data: Any, config_file: str) -> Any:
+    """Parse YAML from bytes or a buffer, naming config_file in error marks."""
+    try:
+        return yaml.load(data, Loader=_SafeLoader)
+    except yaml.MarkedYAMLError as e:
+        # Point error locations at the config file, not a placeholder stream name
+        for attr in ("context_mark", "problem_mark"):
+            mark = getattr(e, attr)
+            if mark is not None:
+                renamed = yaml.Mark(
+                    config_file, mark.index, mark.line, mark.column, None, None
+                )
+                setattr(e, attr, renamed)
+        raise
+
+
+def _config_digest(config_file: str) -> bytes:
+    """Hash config.yml together with everything else that shapes the output."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(config_file, "rb") as f:
+        digest.update(f.read())
+    # Regenerate after parser upgrades or a change of output format
+    st = os.stat(__file__)
+    mode = os.environ.get(PROMETHEUS_JSON_ENV, "")
+    digest.update(f"{st.st_mtime_ns}:{st.st_size}:{mode}".encode())
+    return digest.digest()
+
+
+def _parse_config_file(config_file: str) -> Any:
+    """Parse a YAML file straight from its raw bytes."""
+    # Hand libyaml the raw bytes; it decodes them itself, so skip TextIOWrapper.
+    # Non-empty files are memory-mapped so the parser reads from the page cache.
+    fd = os.open(config_file, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if size > 0:
+            with mmap.mmap(fd, size, prot=mmap.PROT_READ) as data:
+                return _load_yaml(data, config_file)
+        return _load_yaml(b"", config_file)
+    finally:
+        os.close(fd)
 
 
 def load_config(config_file: str) -> Dict[str, Any]:
     """Load and validate configuration from YAML file."""
     try:
-        with open(config_file, "r") as f:
-            config = yaml.safe_load(f)
+        config = _parse_config_file(config_file)
 
         if not config:
             raise ValueError("Configuration file is empty")
@@ -32,84 +220,104 @@ def load_config(config_file: str) -> Dict[str, Any]:
         sys.exit(1)
 
 
-def validate_validators_config(validators: List[Dict[str, Any]]) -> None:
-    """Validate validators configuration structure."""
-    if not isinstance(validators, list):
-        raise ValueError("validators must be a list")
+def _validate_entities(
+    entities: List[Dict[str, Any]],
+    section: str,
+    label: str,
+    required_fields: Tuple[str, ...],
+    validate_alerts: Callable[[Dict[str, Any], int], None],
+    default_alerts: Callable[[], Mapping[str, bool]],
+) -> None:
+    """Validate a list of monitored entities against its required-field schema."""
+    if not isinstance(entities, list):
+        raise ValueError(f"{section} must be a list")
 
-    for i, validator in enumerate(validators):
-        if not isinstance(validator, dict):
-            raise ValueError(f"Validator {i} must be a dictionary")
+    for i, entity in enumerate(entities):
+        if not isinstance(entity, dict):
+            raise ValueError(f"{label} {i} must be a dictionary")
 
-        required_fields = ["alias", "target"]
+        # One lookup per field; the membership test only runs on failure
         for field in required_fields:
-            if field not in validator:
-                raise ValueError(f"Validator {i} missing required field: {field}")
-            if not validator[field]:
-                raise ValueError(f"Validator {i} field '{field}' cannot be empty")
+            if not entity.get(field):
+                if field not in entity:
+                    raise ValueError(f"{label} {i} missing required field: {field}")
+                raise ValueError(f"{label} {i} field '{field}' cannot be empty")
 
         # Validate alerts configuration if present
-        if "alerts" in validator:
-            validate_validator_alerts_config(validator["alerts"], i)
+        if "alerts" in entity:
+            validate_alerts(entity["alerts"], i)
         else:
-            # Set default alerts if not specified
-            validator["alerts"] = get_default_validator_alerts()
-
+            # Set default alerts if not specified; copy, as the defaults may be
+            # a shared read-only view and entities are serialized to JSON
+            entity["alerts"] = dict(default_alerts())
 
-def validate_fullnodes_config(fullnodes: List[Dict[str, Any]]) -> None:
-    """Validate fullnodes configuration structure."""
-    if not isinstance(fullnodes, list):
-        raise ValueError("fullnodes must be a list")
 
-    for i, fullnode in enumerate(fullnodes):
-        if not isinstance(fullnode, dict):
-            raise ValueError(f"Fullnode {i} must be a dictionary")
+def validate_validators_config(validators: List[Dict[str, Any]]) -> None:
+    """Validate validators configuration structure."""
+    _validate_entities(
+        validators,
+        "validators",
+        "Validator",
+        VALIDATOR_REQUIRED_FIELDS,
+        validate_validator_alerts_config,
+        get_default_validator_alerts,
+    )
 
-        required_fields = ["alias", "target"]
-        for field in required_fields:
-            if field not in fullnode:
-                raise ValueError(f"Fullnode {i} missing required field: {field}")
-            if not fullnode[field]:
-                raise ValueError(f"Fullnode {i} field '{field}' cannot be empty")
 
-        # Validate alerts configuration if present
-        if "alerts" in fullnode:
-            validate_fullnode_alerts_config(fullnode["alerts"], i)
-        else:
-            # Set default alerts if not specified
-            fullnode["alerts"] = get_default_fullnode_alerts()
+def validate_fullnodes_config(fullnodes: List[Dict[str, Any]]) -> None:
+    """Validate fullnodes configuration structure."""
+    _validate_entities(
+        fullnodes,
+        "fullnodes",
+        "Fullnode",
+        FULLNODE_REQUIRED_FIELDS,
+        validate_fullnode_alerts_config,
+        get_default_fullnode_alerts,
+    )
 
 
 def validate_bridges_config(bridges: List[Dict[str, Any]]) -> None:
     """Validate bridges configuration structure."""
-    if not isinstance(bridges, list):
-        raise ValueError("bridges must be a list")
-
-    for i, bridge in enumerate(bridges):
-        if not isinstance(bridge, dict):
-            raise ValueError(f"Bridge {i} must be a dictionary")
-
-        required_fields = ["alias", "target", "public_address"]
-        for field in required_fields:
-            if field not in bridge:
-                raise ValueError(f"Bridge {i} missing required field: {field}")
-            if not bridge[field]:
-                raise ValueError(f"Bridge {i} field '{field}' cannot be empty")
+    _validate_entities(
+        bridges,
+        "bridges",
+        "Bridge",
+        BRIDGE_REQUIRED_FIELDS,
+        validate_alerts_config,
+        get_default_alerts,
+    )
+
+
+def _validate_alert_flags(
+    alerts: Any,
+    index: int,
+    label: str,
+    valid_types: FrozenSet[str],
+    default_view: Mapping[str, bool],
+) -> None:
+    """Validate an entity's "alerts" section of alert type -> enabled flag."""
+    # The shared defaults are known to be valid
+    if alerts is default_view:
+        return
+    if not isinstance(alerts, dict):
+        raise ValueError(f"{label} {index} alerts must be a dictionary")
 
-        # Validate alerts configuration if present
-        if "alerts" in bridge:
-            validate_alerts_config(bridge["alerts"], i)
-        else:
-            # Set default alerts if not specified
-            bridge["alerts"] = get_default_alerts()
+    # Fast path: known keys with bool values; otherwise walk in order for the error
+    if alerts.keys() <= valid_types and all(
+        type(enabled) is bool for enabled in alerts.values()
+    ):
+        return
 
+    for alert_type, enabled in alerts.items():
+        if alert_type not in valid_types:
+            raise ValueError(f"{label} {index} has invalid alert type: {alert_type}")
+        if not isinstance(enabled, bool):
+            raise ValueError(f"{label} {index} alert '{alert_type}' must be a boolean")
 
-def validate_alerts_config(alerts: Dict[str, Any], bridge_index: int) -> None:
-    """Validate alerts configuration structure."""
-    if not isinstance(alerts, dict):
-        raise ValueError(f"Bridge {bridge_index} alerts must be a dictionary")
 
-    valid_alert_types = {
+# Alert types accepted under a bridge's "alerts" section
+BRIDGE_ALERT_TYPES = frozenset(
+    {
         # Common alerts
         "uptime",
         "metrics_public_key_availability",
@@ -126,26 +334,19 @@ def validate_alerts_config(alerts: Dict[str, Any], bridge_index: int) -> None:
         "stale_eth_finalization",
         "low_gas_balance",
     }
+)
 
-    for alert_type, enabled in alerts.items():
-        if alert_type not in valid_alert_types:
-            raise ValueError(
-                f"Bridge {bridge_index} has invalid alert type: {alert_type}"
-            )
-        if not isinstance(enabled, bool):
-            raise ValueError(
-                f"Bridge {bridge_index} alert '{alert_type}' must be a boolean"
-            )
 
+def validate_alerts_config(alerts: Dict[str, Any], bridge_index: int) -> None:
+    """Validate alerts configuration structure."""
+    _validate_alert_flags(
+        alerts, bridge_index, "Bridge", BRIDGE_ALERT_TYPES, _DEFAULT_ALERTS_VIEW
+    )
 
-def validate_validator_alerts_config(
-    alerts: Dict[str, Any], validator_index: int
-) -> None:
-    """Validate validator alerts configuration structure."""
-    if not isinstance(alerts, dict):
-        raise ValueError(f"Validator {validator_index} alerts must be a dictionary")
 
-    valid_alert_types = {
+# Alert types accepted under a validator's "alerts" section
+VALIDATOR_ALERT_TYPES = frozenset(
+    {
         "uptime",
         "reputation_rank",
         "voting_power",
@@ -162,1130 +363,816 @@ def validate_validator_alerts_config(
         "checkpoint_execution_rate",
         "sequencing_latency_high",
     }
+)
 
-    for alert_type, enabled in alerts.items():
-        if alert_type not in valid_alert_types:
-            raise ValueError(
-                f"Validator {validator_index} has invalid alert type: {alert_type}"
-            )
-        if not isinstance(enabled, bool):
-            raise ValueError(
-                f"Validator {validator_index} alert '{alert_type}' must be a boolean"
-            )
 
-
-def validate_fullnode_alerts_config(
-    alerts: Dict[str, Any], fullnode_index: int
+def validate_validator_alerts_config(
+    alerts: Dict[str, Any], validator_index: int
 ) -> None:
-    """Validate fullnode alerts configuration structure."""
-    if not isinstance(alerts, dict):
-        raise ValueError(f"Fullnode {fullnode_index} alerts must be a dictionary")
-
-    valid_alert_types = {
+    """Validate validator alerts configuration structure."""
+    _validate_alert_flags(
+        alerts,
+        validator_index,
+        "Validator",
+        VALIDATOR_ALERT_TYPES,
+        _DEFAULT_VALIDATOR_ALERTS_VIEW,
+    )
+
+
+# Alert types accepted under a fullnode's "alerts" section
+FULLNODE_ALERT_TYPES = frozenset(
+    {
         "uptime",
         "checkpoint_execution_rate",
         "checkpoint_sync_status",
     }
+)
 
-    for alert_type, enabled in alerts.items():
-        if alert_type not in valid_alert_types:
-            raise ValueError(
-                f"Fullnode {fullnode_index} has invalid alert type: {alert_type}"
-            )
-        if not isinstance(enabled, bool):
-            raise ValueError(
-                f"Fullnode {fullnode_index} alert '{alert_type}' must be a boolean"
-            )
 
+def validate_fullnode_alerts_config(
+    alerts: Dict[str, Any], fullnode_index: int
+) -> None:
+    """Validate fullnode alerts configuration structure."""
+    _validate_alert_flags(
+        alerts,
+        fullnode_index,
+        "Fullnode",
+        FULLNODE_ALERT_TYPES,
+        _DEFAULT_FULLNODE_ALERTS_VIEW,
+    )
+
+
+# Default bridge alerts (all enabled), exposed read-only via get_default_alerts
+_DEFAULT_ALERTS = {
+    # Common alerts
+    "uptime": True,
+    "metrics_public_key_availability": True,
+    "ingress_access": True,
+    "voting_power": True,
+    # Client-disabled alerts
+    "bridge_requests_errors": True,
+    "bridge_high_latency": True,
+    "bridge_high_cache_misses": True,
+    "bridge_rpc_errors": True,
+    # Client-enabled alerts
+    "stale_sui_sync": True,
+    "stale_eth_sync": True,
+    "stale_eth_finalization": True,
+    "low_gas_balance": True,
+}
+_DEFAULT_ALERTS_VIEW = MappingProxyType(_DEFAULT_ALERTS)
+
+
+def get_default_alerts() -> Mapping[str, bool]:
+    """Get default alerts configuration with all alerts enabled.
+
+    The mapping is shared and read-only; copy it with dict() to modify it.
+    """
+    return _DEFAULT_ALERTS_VIEW
+
+
+# Default validator alerts (all enabled), exposed read-only via
+# get_default_validator_alerts
+_DEFAULT_VALIDATOR_ALERTS = {
+    "uptime": True,
+    "reputation_rank": True,
+    "voting_power": True,
+    "tx_processing_latency_p95": True,
+    "tx_processing_latency_p95_10s": True,
+    "tx_processing_latency_p95_3s": True,
+    "tx_processing_latency_p50": True,
+    "proposal_latency": True,
+    "consensus_proposals_rate": True,
+    "committed_round_rate": True,
+    "fullnode_connectivity": True,
+    "safe_mode": True,
+    "randomness_dkg_failure": True,
+    "checkpoint_execution_rate": True,
+    "sequencing_latency_high": True,
+}
+_DEFAULT_VALIDATOR_ALERTS_VIEW = MappingProxyType(_DEFAULT_VALIDATOR_ALERTS)
+
+
+def get_default_validator_alerts() -> Mapping[str, bool]:
+    """Get default validator alerts configuration with all alerts enabled.
+
+    The mapping is shared and read-only; copy it with dict() to modify it.
+    """
+    return _DEFAULT_VALIDATOR_ALERTS_VIEW
+
+
+# Default fullnode alerts (all enabled), exposed read-only via
+# get_default_fullnode_alerts
+_DEFAULT_FULLNODE_ALERTS = {
+    "uptime": True,
+    "checkpoint_execution_rate": True,
+    "checkpoint_sync_status": True,
+}
+_DEFAULT_FULLNODE_ALERTS_VIEW = MappingProxyType(_DEFAULT_FULLNODE_ALERTS)
+
+
+def get_default_fullnode_alerts() -> Mapping[str, bool]:
+    """Get default fullnode alerts configuration with all alerts enabled.
+
+    The mapping is shared and read-only; copy it with dict() to modify it.
+    """
+    return _DEFAULT_FULLNODE_ALERTS_VIEW
+
+
+class AlertSpec(NamedTuple):
+    """Template for one alert rule, shared by every entity of a kind.
+
+    Templates are formatted with alias=... (and authority=... for expressions).
+    """
+
+    key: str  # flag under the entity's "alerts" section
+    severity: str
+    name_prefix: str  # alert name, suffixed with the underscored alias
+    expr: str
+    for_: str
+    summary: str
+    description: str
+    panel_id: str  # Grafana dashboard panel
+    group: Optional[str] = None  # rule group to write to; severity if unset
+    alert_type: Optional[str] = None  # alert_type label; key if unset
+
+
+# Grafana dashboard the bridge alerts link to
+BRIDGE_DASHBOARD_UID = "d3sdagobbprlcrf8dh3g"
+
+# Bridge alert rule groups, in the order they are written
+BRIDGE_ALERT_GROUPS = ("common", "client_disabled", "client_enabled")
+
+# Bridge alert rules (all critical), in write order within each group
+BRIDGE_ALERT_SPECS = (
+    # Common alerts
+    AlertSpec(
+        "uptime",
+        "critical",
+        "SuiBridge_Uptime",
+        'increase(uptime{{service="sui_bridge", alias="{alias}"}}[10m]) == 0',
+        "1m",
+        "Critical uptime on {{ $labels.instance }} ({alias})",
+        "The uptime for SUI Bridge Node instance {{ $labels.instance }} ({alias}) has not increased in the last 10 minutes, suggesting a restart or failure.",
+        "2",
+        group="common",
+    ),
+    AlertSpec(
+        "metrics_public_key_availability",
+        "critical",
+        "SuiBridge_MetricsPublicKeyAvailability",
+        'probe_success{{service="sui_bridge_health_check", alias="{alias}"}} == 0',
+        "2m",
+        "Metrics Public Key Unavailable (Instance: {{ $labels.instance }}, Environment: {alias})",
+        "The metrics public key endpoint for SUI Bridge Node instance {{ $labels.instance }} ({alias}) is not accessible.",
+        "2",
+        group="common",
+    ),
+    AlertSpec(
+        "ingress_access",
+        "critical",
+        "SuiBridge_IngressAccess",
+        'probe_success{{service="sui_bridge_ingress_check", alias="{alias}"}} == 0',
+        "2m",
+        "Bridge Ingress Unavailable (Instance: {{ $labels.instance }}, Environment: {alias})",
+        "The public ingress endpoint for SUI Bridge Node instance {{ $labels.instance }} ({alias}) is not accessible.",
+        "2",
+        group="common",
+    ),
+    AlertSpec(
+        "voting_power",
+        "critical",
+        "SuiBridge_VotingPower",
+        'current_bridge_voting_rights{{service="sui_bridge", authority="${{SUI_VALIDATOR}}", alias="{alias}"}} == 0',
+        "5m",
+        "Zero Bridge Voting Rights (Instance: {{ $labels.instance }}, Environment: {alias})",
+        "The SUI Bridge Node instance {{ $labels.instance }} ({alias}) has zero voting rights, indicating a potential issue with the validator's authority.",
+        "288",
+        group="common",
+    ),
+    # Client-disabled alerts
+    AlertSpec(
+        "bridge_requests_errors",
+        "critical",
+        "SuiBridge_BridgeRequestErrors",
+        'increase(bridge_err_requests{{service="sui_bridge", type="handle_sui_tx_digest", alias="{alias}"}}[5m]) > 0',
+        "5m",
+        "Bridge Request Errors Detected (Instance: {{ $labels.instance }}, Environment: {alias})",
+        "The SUI Bridge Node instance {{ $labels.instance }} ({alias}) detected errors while handling SUI transaction digests in the last 5 minutes.",
+        "294",
+        group="client_disabled",
+    ),
+    AlertSpec(
+        "bridge_high_latency",
+        "critical",
+        "SuiBridge_HighETHRPCLatency",
+        'bridge_eth_rpc_queries_latency{{service="sui_bridge", alias="{alias}"}} > 5000',
+        "5m",
+        "High ETH RPC Latency (Instance: {{ $labels.instance }}, Environment: {alias})",
+        "The ETH RPC queries latency for SUI Bridge Node instance {{ $labels.instance }} ({alias}) is above 5 seconds.",
+        "294",
+        group="client_disabled",
+    ),
+    AlertSpec(
+        "bridge_high_cache_misses",
+        "critical",
+        "SuiBridge_HighCacheMisses",
+        '(rate(bridge_signer_with_cache_miss{{service="sui_bridge", alias="{alias}"}}[5m]) / (rate(bridge_signer_with_cache_hit{{service="sui_bridge", alias="{alias}"}}[5m]) + rate(bridge_signer_with_cache_miss{{service="sui_bridge", alias="{alias}"}}[5m]))) > 0.5',
+        "5m",
+        "High Cache Miss Rate (Instance: {{ $labels.instance }}, Environment: {alias})",
+        "The cache miss rate for SUI Bridge Node instance {{ $labels.instance }} ({alias}) is above 50%.",
+        "305",
+        group="client_disabled",
+    ),
+    AlertSpec(
+        "bridge_rpc_errors",
+        "critical",
+        "SuiBridge_SUIRPCErrors",
+        'increase(bridge_sui_rpc_errors{{service="sui_bridge", alias="{alias}"}}[5m]) > 0',
+        "5m",
+        "SUI RPC Errors Detected (Instance: {{ $labels.instance }}, Environment: {alias})",
+        "SUI RPC errors detected for SUI Bridge Node instance {{ $labels.instance }} ({alias}) in the last 5 minutes.",
+        "322",
+        group="client_disabled",
+    ),
+    # Client-enabled alerts
+    AlertSpec(
+        "stale_sui_sync",
+        "critical",
+        "SuiBridge_StaleSUISync",
+        'increase(bridge_last_synced_sui_checkpoints{{service="sui_bridge", module_name="bridge", alias="{alias}"}}[30m]) == 0',
+        "1m",
+        "Bridge Last Synced Checkpoints Not Increasing (Instance: {{ $labels.instance }}, Environment: {alias})",
+        "Bridge Last Synced Checkpoints on {{ $labels.instance }} ({alias}) are not increasing for the last 30 minutes.",
+        "331",
+        group="client_enabled",
+    ),
+    AlertSpec(
+        "stale_eth_sync",
+        "critical",
+        "SuiBridge_StaleETHSync",
+        'increase(bridge_last_synced_eth_blocks{{service="sui_bridge", alias="{alias}"}}[30m]) == 0',
+        "1m",
+        "Bridge Last Synced ETH Blocks Not Increasing (Instance: {{ $labels.instance }}, Environment: {alias})",
+        "Bridge Last Synced ETH Blocks on {{ $labels.instance }} ({alias}) are not increasing for the last 30 minutes.",
+        "324",
+        group="client_enabled",
+    ),
+    AlertSpec(
+        "stale_eth_finalization",
+        "critical",
+        "SuiBridge_StaleETHFinalization",
+        'increase(bridge_last_finalized_eth_block{{service="sui_bridge", alias="{alias}"}}[10m]) == 0',
+        "1m",
+        "Bridge Finalized ETH Block Not Increasing (Instance: {{ $labels.instance }}, Environment: {alias})",
+        "Bridge Finalized ETH Block on {{ $labels.instance }} ({alias}) is not increasing for the last 10 minutes.",
+        "324",
+        group="client_enabled",
+    ),
+    AlertSpec(
+        "low_gas_balance",
+        "critical",
+        "SuiBridge_LowGasBalance",
+        'bridge_gas_coin_balance{{service="sui_bridge", alias="{alias}"}} < 10000000000',
+        "1m",
+        "Bridge Client Balance Running Low (Instance: {{ $labels.instance }}, Environment: {alias})",
+        "Bridge Client Balance on {{ $labels.instance }} ({alias}) is running out of tokens (below 10 SUI).",
+        "316",
+        group="client_enabled",
+    ),
+)
 
-def get_default_alerts() -> Dict[str, bool]:
-    """Get default alerts configuration with all alerts enabled."""
-    return {
-        # Common alerts
-        "uptime": True,
-        "metrics_public_key_availability": True,
-        "ingress_access": True,
-        "voting_power": True,
-        # Client-disabled alerts
-        "bridge_requests_errors": True,
-        "bridge_high_latency": True,
-        "bridge_high_cache_misses": True,
-        "bridge_rpc_errors": True,
-        # Client-enabled alerts
-        "stale_sui_sync": True,
-        "stale_eth_sync": True,
-        "stale_eth_finalization": True,
-        "low_gas_balance": True,
-    }
 
+# Upper-cased alert names used in the exported SUI_BRIDGE_<i>_ALERT_* variables
+BRIDGE_ALERT_ENV_NAMES = {spec.key: spec.key.upper() for spec in BRIDGE_ALERT_SPECS}
 
-def get_default_validator_alerts() -> Dict[str, bool]:
-    """Get default validator alerts configuration with all alerts enabled."""
-    return {
-        "uptime": True,
-        "reputation_rank": True,
-        "voting_power": True,
-        "tx_processing_latency_p95": True,
-        "tx_processing_latency_p95_10s": True,
-        "tx_processing_latency_p95_3s": True,
-        "tx_processing_latency_p50": True,
-        "proposal_latency": True,
-        "consensus_proposals_rate": True,
-        "committed_round_rate": True,
-        "fullnode_connectivity": True,
-        "safe_mode": True,
-        "randomness_dkg_failure": True,
-        "checkpoint_execution_rate": True,
-        "sequencing_latency_high": True,
-    }
 
+# Grafana dashboard the fullnode alerts link to
+FULLNODE_DASHBOARD_UID = "f3sdas8bbprlibnio2f0"
 
-def get_default_fullnode_alerts() -> Dict[str, bool]:
-    """Get default fullnode alerts configuration with all alerts enabled."""
+# Fullnode alert rules (all critical). Unlike the bridge and validator rules,
+# these render "{{ $labels.instance }}" in annotations, hence the doubled braces
+FULLNODE_ALERT_SPECS = (
+    AlertSpec(
+        "uptime",
+        "critical",
+        "SuiFullnode_Uptime",
+        'rate(uptime{{alias="{alias}"}}[5m]) == 0',
+        "2m",
+        "Fullnode Uptime Issue (Instance: {{{{ $labels.instance }}}}, Environment: {alias})",
+        "The uptime for SUI Fullnode instance {{{{ $labels.instance }}}} ({alias}) is not increasing, suggesting a potential restart or failure.",
+        "347",
+    ),
+    AlertSpec(
+        "checkpoint_execution_rate",
+        "critical",
+        "SuiFullnode_CheckpointExecutionRateLow",
+        'rate(last_executed_checkpoint{{alias="{alias}"}}[5m]) < 2',
+        "5m",
+        "Checkpoint Execution Rate Is Low (Instance: {{{{ $labels.instance }}}}, Environment: {alias})",
+        "The checkpoint execution rate for SUI Fullnode instance {{{{ $labels.instance }}}} ({alias}) is below 2 checkpoints per second.",
+        "274",
+    ),
+    AlertSpec(
+        "checkpoint_sync_status",
+        "critical",
+        "SuiFullnode_CheckpointSyncLow",
+        '(last_executed_checkpoint{{alias="{alias}"}}/highest_synced_checkpoint{{alias="{alias}"}}) < 0.95',
+        "5m",
+        "Checkpoint Sync Status Low (Instance: {{{{ $labels.instance }}}}, Environment: {alias})",
+        "The checkpoint sync ratio for SUI Fullnode instance {{{{ $labels.instance }}}} ({alias}) is below 95%, indicating the fullnode is falling behind.",
+        "280",
+    ),
+)
+
+
+# Grafana dashboard the validator alerts link to
+VALIDATOR_DASHBOARD_UID = "d3sdas8bbprlibnio2n0"
+
+# Validator alert rules, grouped by severity in table order
+VALIDATOR_ALERT_SPECS = (
+    AlertSpec(
+        "uptime",
+        "critical",
+        "SuiValidator_Uptime",
+        'rate(uptime{{alias="{alias}"}}[5m]) == 0',
+        "2m",
+        "Validator Uptime Issue (Instance: {{ $labels.instance }}, Environment: {alias})",
+        "The uptime for SUI Validator instance {{ $labels.instance }} ({alias}) is not increasing, suggesting a potential restart or failure.",
+        "347",
+    ),
+    AlertSpec(
+        "reputation_rank",
+        "warning",
+        "SuiValidator_ReputationRank",
+        '(scalar(consensus_reputation_scores{{alias="{alias}", authority="{authority}"}}) <= bool max(bottomk(scalar(consensus_handler_num_low_scoring_authorities{{alias="{alias}"}}), consensus_reputation_scores{{alias="{alias}"}}))) == 1',
+        "30m",
+        "Validator Low Reputation Rank (Instance: {{ $labels.instance }}, Environment: {alias})",
+        "The SUI Validator instance {{ $labels.instance }} ({alias}) is in the bottom N low-scoring validators based on consensus reputation scores.",
+        "366",
+    ),
+    AlertSpec(
+        "voting_power",
+        "critical",
+        "SuiValidator_VotingPower",
+        'current_voting_right{{alias="{alias}"}} == 0',
+        "5m",
+        "Zero Validator Voting Power (Instance: {{ $labels.instance }}, Environment: {alias})",
+        "The SUI Validator instance {{ $labels.instance }} ({alias}) has zero voting power, indicating a critical issue with the validator's authority.",
+        "268",
+    ),
+    AlertSpec(
+        "tx_processing_latency_p95",
+        "critical",
+        "SuiValidator_TxProcessingLatencyP95",
+        'histogram_quantile(0.95, rate(validator_service_handle_certificate_consensus_latency_bucket{{alias="{alias}"}}[5m])) > 15000',
+        "5m",
+        "High Transaction Processing Latency P95 (Instance: {{ $labels.instance }}, Environment: {alias})",
+        "The 95th percentile transaction processing latency for SUI Validator instance {{ $labels.instance }} ({alias}) is above 15 seconds.",
+        "295",
+    ),
+    AlertSpec(
+        "tx_processing_latency_p95_10s",
+        "warning",
+        "SuiValidator_TxProcessingLatencyP95_10s",
+        'histogram_quantile(0.95, rate(validator_service_handle_certificate_consensus_latency_bucket{{alias="{alias}"}}[5m])) > 10000',
+        "5m",
+        "Elevated Transaction Processing Latency P95 (Instance: {{ $labels.instance }}, Environment: {alias})",
+        "The 95th percentile transaction processing latency for SUI Validator instance {{ $labels.instance }} ({alias}) is above 10 seconds.",
+        "295",
+    ),
+    AlertSpec(
+        "tx_processing_latency_p95_3s",
+        "warning",
+        "SuiValidator_TxProcessingLatencyP95_3s",
+        'histogram_quantile(0.95, rate(validator_service_handle_certificate_consensus_latency_bucket{{alias="{alias}"}}[5m])) > 3000',
+        "5m",
+        "Moderate Transaction Processing Latency P95 (Instance: {{ $labels.instance }}, Environment: {alias})",
+        "The 95th percentile transaction processing latency for SUI Validator instance {{ $labels.instance }} ({alias}) is above 3 seconds.",
+        "295",
+    ),
+    AlertSpec(
+        "tx_processing_latency_p50",
+        "critical",
+        "SuiValidator_TxProcessingLatencyP50",
+        'histogram_quantile(0.50, rate(validator_service_handle_certificate_consensus_latency_bucket{{alias="{alias}"}}[5m])) > 5000',
+        "5m",
+        "High Transaction Processing Latency P50 (Instance: {{ $labels.instance }}, Environment: {alias})",
+        "The 50th percentile transaction processing latency for SUI Validator instance {{ $labels.instance }} ({alias}) is above 5 seconds.",
+        "295",
+    ),
+    AlertSpec(
+        "proposal_latency",
+        "critical",
+        "SuiValidator_ProposalLatency",
+        'rate(consensus_quorum_receive_latency_sum{{alias="{alias}"}}[5m]) / rate(consensus_quorum_receive_latency_count{{alias="{alias}"}}[5m]) > 2',
+        "5m",
+        "High Consensus Proposal Latency (Instance: {{ $labels.instance }}, Environment: {alias})",
+        "The consensus proposal latency for SUI Validator instance {{ $labels.instance }} ({alias}) is above 2 seconds.",
+        "342",
+    ),
+    AlertSpec(
+        "consensus_proposals_rate",
+        "critical",
+        "SuiValidator_ConsensusProposalsRate",
+        'sum(rate(consensus_proposed_blocks{{alias="{alias}", force="false"}}[5m])) + sum(rate(consensus_proposed_blocks{{alias="{alias}", force="true"}}[5m])) < 3',
+        "5m",
+        "Low Consensus Proposals Rate (Instance: {{ $labels.instance }}, Environment: {alias})",
+        "The consensus proposals rate for SUI Validator instance {{ $labels.instance }} ({alias}) is below 3 blocks per second.",
+        "295",
+    ),
+    AlertSpec(
+        "safe_mode",
+        "critical",
+        "SuiValidator_SafeMode",
+        'is_safe_mode{{alias="{alias}"}} > 0.5 or absent(is_safe_mode{{alias="{alias}"}})',
+        "5m",
+        "Safe Mode during Reconfiguration (Instance: {{ $labels.instance }}, Environment: {alias})",
+        "Epoch failed to advance; chain entered safe mode for SUI Validator instance {{ $labels.instance }} ({alias}).",
+        "256",
+    ),
+    AlertSpec(
+        "randomness_dkg_failure",
+        "critical",
+        "SuiValidator_RandomnessBeaconDKGFailed",
+        'epoch_random_beacon_dkg_failed{{alias="{alias}"}} > 0 or absent(epoch_random_beacon_dkg_failed{{alias="{alias}"}})',
+        "5m",
+        "Randomness DKG Failure (Instance: {{ $labels.instance }}, Environment: {alias})",
+        "Random beacon DKG has failed on one or more hosts for SUI Validator instance {{ $labels.instance }} ({alias}).",
+        "400",
+    ),
+    AlertSpec(
+        "checkpoint_execution_rate",
+        "critical",
+        "SuiValidator_CheckpointExecutionRateLow",
+        'rate(last_executed_checkpoint{{alias="{alias}"}}[5m]) < 2',
+        "5m",
+        "Checkpoint Execution Rate Is Low (Instance: {{ $labels.instance }}, Environment: {alias})",
+        "The checkpoint execution rate for SUI Validator instance {{ $labels.instance }} ({alias}) is below 2 checkpoints per second.",
+        "274",
+    ),
+    AlertSpec(
+        "committed_round_rate",
+        "critical",
+        "SuiValidator_CommittedRoundRate",
+        'rate(consensus_last_committed_leader_round{{alias="{alias}"}}[2m]) < 3',
+        "5m",
+        "Low Committed Round Rate (Instance: {{ $labels.instance }}, Environment: {alias})",
+        "The committed round rate for SUI Validator instance {{ $labels.instance }} ({alias}) is below 3 rounds per second.",
+        "241",
+    ),
+    AlertSpec(
+        "fullnode_connectivity",
+        "critical",
+        "SuiValidator_FullnodeConnectivity",
+        'rate(total_rpc_err{{alias="{alias}", name="{authority}"}}[2m]) > 0',
+        "5m",
+        "Fullnode Connectivity Issues (Instance: {{ $labels.instance }}, Environment: {alias})",
+        "The SUI Validator instance {{ $labels.instance }} ({alias}) is experiencing RPC errors indicating connectivity issues with fullnodes.",
+        "390",
+    ),
+    AlertSpec(
+        "sequencing_latency_high",
+        "warning",
+        "SuiValidator_SequencingLatencyHigh",
+        'histogram_quantile(0.99, sum by(le) (rate(sequencing_certificate_latency_bucket{{alias="{alias}", position="0", tx_type=~"shared_certificate|owned_certificate|soft_bundle"}}[2m]))) > 10',
+        "1m",
+        "Consensus Sequencing p99 Latencies are High (Instance: {{ $labels.instance }}, Environment: {alias})",
+        "Consensus sequencing latency is too high for SUI Validator instance {{ $labels.instance }} ({alias}).",
+        "258",
+        alert_type="sequencing_latency",
+    ),
+)
+
+
+# Alert rule sets per entity kind as (default alerts getter, dashboard uid,
+# group names in write order, alert specs)
+_RULE_SETS = {
+    "bridge": (
+        get_default_alerts,
+        BRIDGE_DASHBOARD_UID,
+        BRIDGE_ALERT_GROUPS,
+        BRIDGE_ALERT_SPECS,
+    ),
+    "validator": (
+        get_default_validator_alerts,
+        VALIDATOR_DASHBOARD_UID,
+        ("critical", "warning"),
+        VALIDATOR_ALERT_SPECS,
+    ),
+    "fullnode": (
+        get_default_fullnode_alerts,
+        FULLNODE_DASHBOARD_UID,
+        ("critical",),
+        FULLNODE_ALERT_SPECS,
+    ),
+}
+
+
+def _build_rule(
+    name: str,
+    expr: str,
+    for_: str,
+    labels: Dict[str, str],
+    summary: str,
+    description: str,
+    dashboard_uid: str,
+    panel_id: str,
+) -> Dict[str, Any]:
+    """Assemble one Prometheus alerting rule in the generated file layout."""
     return {
-        "uptime": True,
-        "checkpoint_execution_rate": True,
-        "checkpoint_sync_status": True,
+        "alert": name,
+        "expr": expr,
+        "for": for_,
+        "labels": labels,
+        "annotations": {
+            "summary": summary,
+            "description": description,
+            "__dashboardUid__": dashboard_uid,
+            "__panelId__": panel_id,
+        },
     }
 
 
-def generate_alert_rules(bridges: List[Dict[str, Any]], output_dir: str) -> None:
-    """Generate bridge-specific alert rules organized by bridge."""
-
-    import os
-
-    # Create output directory if it doesn't exist
-    os.makedirs(output_dir, exist_ok=True)
-
-    # Generate individual bridge alert files
-    for i, bridge in enumerate(bridges):
-        alias = bridge["alias"]
-        alerts = bridge.get("alerts", get_default_alerts())
-
-        # Sanitize alias for filename
-        safe_alias = alias.lower().replace(" ", "_").replace("-", "_")
-        bridge_file = os.path.join(
-            output_dir, f"sui_bridge_{i}_{safe_alias}_alerts.yml"
-        )
-
-        bridge_rules = {"groups": []}
-
-        # Common alerts group for this bridge
-        common_alerts = []
-
-        # Client-disabled alerts group for this bridge
-        client_disabled_alerts = []
-
-        # Client-enabled alerts group for this bridge
-        client_enabled_alerts = []
-
-        # Generate bridge-specific alert rules based on enabled alerts
-        if alerts.get("uptime", False):
-            common_alerts.append(
-                {
-                    "alert": f"SuiBridge_Uptime_{alias.replace(' ', '_')}",
-                    "expr": f'increase(uptime{{service="sui_bridge", alias="{alias}"}}[10m]) == 0',
-                    "for": "1m",
-                    "labels": {
-                        "severity": "critical",
-                        "service": "sui_bridge",
-                        "instance": "{{ $labels.instance }}",
-                        "alias": f'"{alias}"',
-                        "alert_type": "uptime",
-                        "bridge_index": str(i),
-                        "bridge_alias": alias,
-                    },
-                    "annotations": {
-                        "summary": f"Critical uptime on {{ $labels.instance }} ({alias})",
-                        "description": f"The uptime for SUI Bridge Node instance {{ $labels.instance }} ({alias}) has not increased in the last 10 minutes, suggesting a restart or failure.",
-                        "__dashboardUid__": "d3sdagobbprlcrf8dh3g",
-                        "__panelId__": "2",
-                    },
-                }
-            )
-
-        if alerts.get("metrics_public_key_availability", False):
-            common_alerts.append(
-                {
-                    "alert": f"SuiBridge_MetricsPublicKeyAvailability_{alias.replace(' ', '_')}",
-                    "expr": f'probe_success{{service="sui_bridge_health_check", alias="{alias}"}} == 0',
-                    "for": "2m",
-                    "labels": {
-                        "severity": "critical",
-                        "service": "sui_bridge",
-                        "instance": "{{ $labels.instance }}",
-                        "alias": f'"{alias}"',
-                        "alert_type": "metrics_public_key_availability",
-                        "bridge_index": str(i),
-                        "bridge_alias": alias,
-                    },
-                    "annotations": {
-                        "summary": f"Metrics Public Key Unavailable (Instance: {{ $labels.instance }}, Environment: {alias})",
-                        "description": f"The metrics public key endpoint for SUI Bridge Node instance {{ $labels.instance }} ({alias}) is not accessible.",
-                        "__dashboardUid__": "d3sdagobbprlcrf8dh3g",
-                        "__panelId__": "2",
-                    },
-                }
-            )
-
-        if alerts.get("ingress_access", False):
-            common_alerts.append(
-                {
-                    "alert": f"SuiBridge_IngressAccess_{alias.replace(' ', '_')}",
-                    "expr": f'probe_success{{service="sui_bridge_ingress_check", alias="{alias}"}} == 0',
-                    "for": "2m",
-                    "labels": {
-                        "severity": "critical",
-                        "service": "sui_bridge",
-                        "instance": "{{ $labels.instance }}",
-                        "alias": f'"{alias}"',
-                        "alert_type": "ingress_access",
-                        "bridge_index": str(i),
-                        "bridge_alias": alias,
-                    },
-                    "annotations": {
-                        "summary": f"Bridge Ingress Unavailable (Instance: {{ $labels.instance }}, Environment: {alias})",
-                        "description": f"The public ingress endpoint for SUI Bridge Node instance {{ $labels.instance }} ({alias}) is not accessible.",
-                        "__dashboardUid__": "d3sdagobbprlcrf8dh3g",
-                        "__panelId__": "2",
-                    },
-                }
-            )
-
-        if alerts.get("voting_power", False):
-            common_alerts.append(
-                {
-                    "alert": f"SuiBridge_VotingPower_{alias.replace(' ', '_')}",
-                    "expr": f'current_bridge_voting_rights{{service="sui_bridge", authority="${{SUI_VALIDATOR}}", alias="{alias}"}} == 0',
-                    "for": "5m",
-                    "labels": {
-                        "severity": "critical",
-                        "service": "sui_bridge",
-                        "instance": "{{ $labels.instance }}",
-                        "alias": f'"{alias}"',
-                        "alert_type": "voting_power",
-                        "bridge_index": str(i),
-                        "bridge_alias": alias,
-                    },
-                    "annotations": {
-                        "summary": f"Zero Bridge Voting Rights (Instance: {{ $labels.instance }}, Environment: {alias})",
-                        "description": f"The SUI Bridge Node instance {{ $labels.instance }} ({alias}) has zero voting rights, indicating a potential issue with the validator's authority.",
-                        "__dashboardUid__": "d3sdagobbprlcrf8dh3g",
-                        "__panelId__": "288",
-                    },
-                }
-            )
-
-        # Client-disabled alerts
-        if alerts.get("bridge_requests_errors", False):
-            client_disabled_alerts.append(
-                {
-                    "alert": f"SuiBridge_BridgeRequestErrors_{alias.replace(' ', '_')}",
-                    "expr": f'increase(bridge_err_requests{{service="sui_bridge", type="handle_sui_tx_digest", alias="{alias}"}}[5m]) > 0',
-                    "for": "5m",
-                    "labels": {
-                        "severity": "critical",
-                        "service": "sui_bridge",
-                        "instance": "{{ $labels.instance }}",
-                        "alias": f'"{alias}"',
-                        "alert_type": "bridge_requests_errors",
-                        "bridge_index": str(i),
-                        "bridge_alias": alias,
-                    },
-                    "annotations": {
-                        "summary": f"Bridge Request Errors Detected (Instance: {{ $labels.instance }}, Environment: {alias})",
-                        "description": f"The SUI Bridge Node instance {{ $labels.instance }} ({alias}) detected errors while handling SUI transaction digests in the last 5 minutes.",
-                        "__dashboardUid__": "d3sdagobbprlcrf8dh3g",
-                        "__panelId__": "294",
-                    },
-                }
-            )
-
-        if alerts.get("bridge_high_latency", False):
-            client_disabled_alerts.append(
-                {
-                    "alert": f"SuiBridge_HighETHRPCLatency_{alias.replace(' ', '_')}",
-                    "expr": f'bridge_eth_rpc_queries_latency{{service="sui_bridge", alias="{alias}"}} > 5000',
-                    "for": "5m",
-                    "labels": {
-                        "severity": "critical",
-                        "service": "sui_bridge",
-                        "instance": "{{ $labels.instance }}",
-                        "alias": f'"{alias}"',
-                        "alert_type": "bridge_high_latency",
-                        "bridge_index": str(i),
-                        "bridge_alias": alias,
-                    },
-                    "annotations": {
-                        "summary": f"High ETH RPC Latency (Instance: {{ $labels.instance }}, Environment: {alias})",
-                        "description": f"The ETH RPC queries latency for SUI Bridge Node instance {{ $labels.instance }} ({alias}) is above 5 seconds.",
-                        "__dashboardUid__": "d3sdagobbprlcrf8dh3g",
-                        "__panelId__": "294",
-                    },
-                }
-            )
-
-        if alerts.get("bridge_high_cache_misses", False):
-            client_disabled_alerts.append(
-                {
-                    "alert": f"SuiBridge_HighCacheMisses_{alias.replace(' ', '_')}",
-                    "expr": f'(rate(bridge_signer_with_cache_miss{{service="sui_bridge", alias="{alias}"}}[5m]) / (rate(bridge_signer_with_cache_hit{{service="sui_bridge", alias="{alias}"}}[5m]) + rate(bridge_signer_with_cache_miss{{service="sui_bridge", alias="{alias}"}}[5m]))) > 0.5',
-                    "for": "5m",
-                    "labels": {
-                        "severity": "critical",
-                        "service": "sui_bridge",
-                        "instance": "{{ $labels.instance }}",
-                        "alias": f'"{alias}"',
-                        "alert_type": "bridge_high_cache_misses",
-                        "bridge_index": str(i),
-                        "bridge_alias": alias,
-                    },
-                    "annotations": {
-                        "summary": f"High Cache Miss Rate (Instance: {{ $labels.instance }}, Environment: {alias})",
-                        "description": f"The cache miss rate for SUI Bridge Node instance {{ $labels.instance }} ({alias}) is above 50%.",
-                        "__dashboardUid__": "d3sdagobbprlcrf8dh3g",
-                        "__panelId__": "305",
-                    },
-                }
-            )
-
-        if alerts.get("bridge_rpc_errors", False):
-            client_disabled_alerts.append(
-                {
-                    "alert": f"SuiBridge_SUIRPCErrors_{alias.replace(' ', '_')}",
-                    "expr": f'increase(bridge_sui_rpc_errors{{service="sui_bridge", alias="{alias}"}}[5m]) > 0',
-                    "for": "5m",
-                    "labels": {
-                        "severity": "critical",
-                        "service": "sui_bridge",
-                        "instance": "{{ $labels.instance }}",
-                        "alias": f'"{alias}"',
-                        "alert_type": "bridge_rpc_errors",
-                        "bridge_index": str(i),
-                        "bridge_alias": alias,
-                    },
-                    "annotations": {
-                        "summary": f"SUI RPC Errors Detected (Instance: {{ $labels.instance }}, Environment: {alias})",
-                        "description": f"SUI RPC errors detected for SUI Bridge Node instance {{ $labels.instance }} ({alias}) in the last 5 minutes.",
-                        "__dashboardUid__": "d3sdagobbprlcrf8dh3g",
-                        "__panelId__": "322",
-                    },
-                }
-            )
+def _make_labels(kind: str, i: int, alias: str) -> Dict[str, Optional[str]]:
+    """Build the labels shared by every alert rule of one entity.
 
-        # Client-enabled alerts
-        if alerts.get("stale_sui_sync", False):
-            client_enabled_alerts.append(
-                {
-                    "alert": f"SuiBridge_StaleSUISync_{alias.replace(' ', '_')}",
-                    "expr": f'increase(bridge_last_synced_sui_checkpoints{{service="sui_bridge", module_name="bridge", alias="{alias}"}}[30m]) == 0',
-                    "for": "1m",
-                    "labels": {
-                        "severity": "critical",
-                        "service": "sui_bridge",
-                        "instance": "{{ $labels.instance }}",
-                        "alias": f'"{alias}"',
-                        "alert_type": "stale_sui_sync",
-                        "bridge_index": str(i),
-                        "bridge_alias": alias,
-                    },
-                    "annotations": {
-                        "summary": f"Bridge Last Synced Checkpoints Not Increasing (Instance: {{ $labels.instance }}, Environment: {alias})",
-                        "description": f"Bridge Last Synced Checkpoints on {{ $labels.instance }} ({alias}) are not increasing for the last 30 minutes.",
-                        "__dashboardUid__": "d3sdagobbprlcrf8dh3g",
-                        "__panelId__": "331",
-                    },
-                }
-            )
+    severity and alert_type are placeholders that keep the label order; each
+    rule copies the dict and fills them in.
+    """
+    return {
+        "severity": None,
+        "service": f"sui_{kind}",
+        "instance": "{{ $labels.instance }}",
+        "alias": f'"{alias}"',
+        "alert_type": None,
+        f"{kind}_index": str(i),
+        f"{kind}_alias": alias,
+    }
 
-        if alerts.get("stale_eth_sync", False):
-            client_enabled_alerts.append(
-                {
-                    "alert": f"SuiBridge_StaleETHSync_{alias.replace(' ', '_')}",
-                    "expr": f'increase(bridge_last_synced_eth_blocks{{service="sui_bridge", alias="{alias}"}}[30m]) == 0',
-                    "for": "1m",
-                    "labels": {
-                        "severity": "critical",
-                        "service": "sui_bridge",
-                        "instance": "{{ $labels.instance }}",
-                        "alias": f'"{alias}"',
-                        "alert_type": "stale_eth_sync",
-                        "bridge_index": str(i),
-                        "bridge_alias": alias,
-                    },
-                    "annotations": {
-                        "summary": f"Bridge Last Synced ETH Blocks Not Increasing (Instance: {{ $labels.instance }}, Environment: {alias})",
-                        "description": f"Bridge Last Synced ETH Blocks on {{ $labels.instance }} ({alias}) are not increasing for the last 30 minutes.",
-                        "__dashboardUid__": "d3sdagobbprlcrf8dh3g",
-                        "__panelId__": "324",
-                    },
-                }
-            )
 
-        if alerts.get("stale_eth_finalization", False):
-            client_enabled_alerts.append(
-                {
-                    "alert": f"SuiBridge_StaleETHFinalization_{alias.replace(' ', '_')}",
-                    "expr": f'increase(bridge_last_finalized_eth_block{{service="sui_bridge", alias="{alias}"}}[10m]) == 0',
-                    "for": "1m",
-                    "labels": {
-                        "severity": "critical",
-                        "service": "sui_bridge",
-                        "instance": "{{ $labels.instance }}",
-                        "alias": f'"{alias}"',
-                        "alert_type": "stale_eth_finalization",
-                        "bridge_index": str(i),
-                        "bridge_alias": alias,
-                    },
-                    "annotations": {
-                        "summary": f"Bridge Finalized ETH Block Not Increasing (Instance: {{ $labels.instance }}, Environment: {alias})",
-                        "description": f"Bridge Finalized ETH Block on {{ $labels.instance }} ({alias}) is not increasing for the last 10 minutes.",
-                        "__dashboardUid__": "d3sdagobbprlcrf8dh3g",
-                        "__panelId__": "324",
-                    },
-                }
+def _run_per_entity(
+    fn: Callable[..., Any], entities: List[Dict[str, Any]], *args: Any
+) -> List[Any]:
+    """Call fn(i, entity, *args) for every entity and return results in order.
+
+    Entity files are independent, so they are written from a few threads.
+    """
+    indexes = range(len(entities))
+    repeated = [[arg] * len(entities) for arg in args]
+    if len(entities) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(entities))) as executor:
+            return list(executor.map(fn, indexes, entities, *repeated))
+    return list(map(fn, indexes, entities, *repeated))
+
+
+def _emit_entity_rules(
+    i: int,
+    entity: Dict[str, Any],
+    kind: str,
+    authority: Optional[str],
+    output_dir: str,
+) -> Tuple[str, Optional[Exception]]:
+    """Write the alert rules file for one bridge, validator or fullnode.
+
+    Returns the file path and the error raised while writing it, if any.
+    """
+    default_alerts, dashboard_uid, groups, specs = _RULE_SETS[kind]
+    alias = entity["alias"]
+    alerts = entity.get("alerts", default_alerts())
+    alias_us = alias.replace(" ", "_")
+
+    # Sanitize alias for filename
+    safe_alias = alias.lower().replace(" ", "_").replace("-", "_")
+    rules_file = os.path.join(output_dir, f"sui_{kind}_{i}_{safe_alias}_alerts.yml")
+
+    labels_template = _make_labels(kind, i, alias)
+
+    # Generate entity-specific alert rules based on enabled alerts
+    group_rules = {group: [] for group in groups}
+    for spec in specs:
+        if not alerts.get(spec.key, False):
+            continue
+        labels = labels_template.copy()
+        labels["severity"] = spec.severity
+        labels["alert_type"] = spec.alert_type or spec.key
+        group_rules[spec.group or spec.severity].append(
+            _build_rule(
+                f"{spec.name_prefix}_{alias_us}",
+                spec.expr.format(alias=alias, authority=authority),
+                spec.for_,
+                labels,
+                spec.summary.format(alias=alias),
+                spec.description.format(alias=alias),
+                dashboard_uid,
+                spec.panel_id,
             )
+        )
 
-        if alerts.get("low_gas_balance", False):
-            client_enabled_alerts.append(
-                {
-                    "alert": f"SuiBridge_LowGasBalance_{alias.replace(' ', '_')}",
-                    "expr": f'bridge_gas_coin_balance{{service="sui_bridge", alias="{alias}"}} < 10000000000',
-                    "for": "1m",
-                    "labels": {
-                        "severity": "critical",
-                        "service": "sui_bridge",
-                        "instance": "{{ $labels.instance }}",
-                        "alias": f'"{alias}"',
-                        "alert_type": "low_gas_balance",
-                        "bridge_index": str(i),
-                        "bridge_alias": alias,
-                    },
-                    "annotations": {
-                        "summary": f"Bridge Client Balance Running Low (Instance: {{ $labels.instance }}, Environment: {alias})",
-                        "description": f"Bridge Client Balance on {{ $labels.instance }} ({alias}) is running out of tokens (below 10 SUI).",
-                        "__dashboardUid__": "d3sdagobbprlcrf8dh3g",
-                        "__panelId__": "316",
-                    },
-                }
-            )
+    # Write entity-specific alert rules file
+    try:
+        if _json_output():
+            rule_groups = [
+                {"name": f"sui_{kind}_{group}_alerts_{alias_us}", "rules": rules}
+                for group, rules in group_rules.items()
+                if rules
+            ]
+            with open(rules_file, "wb") as f:
+                f.write(_dumps_json({"groups": rule_groups}))
+            return rules_file, None
+
+        # Emit one group at a time; a single-item list dumps exactly as that
+        # item nested under "groups:"
+        with open(rules_file, "wb", buffering=YAML_WRITE_BUFFER_SIZE) as f:
+            f.write(b"groups:\n" if any(group_rules.values()) else b"groups: []\n")
+            for group, rules in group_rules.items():
+                if not rules:
+                    continue
+                group_name = f"sui_{kind}_{group}_alerts_{alias_us}"
+                _dump_yaml([{"name": group_name, "rules": rules}], f)
+    except Exception as e:
+        return rules_file, e
+    return rules_file, None
 
-        # Add groups to bridge rules
-        if common_alerts:
-            bridge_rules["groups"].append(
-                {
-                    "name": f"sui_bridge_common_alerts_{alias.replace(' ', '_')}",
-                    "rules": common_alerts,
-                }
-            )
 
-        if client_disabled_alerts:
-            bridge_rules["groups"].append(
-                {
-                    "name": f"sui_bridge_client_disabled_alerts_{alias.replace(' ', '_')}",
-                    "rules": client_disabled_alerts,
-                }
-            )
+def _render_entity_rules(
+    kind: str,
+    entities: List[Dict[str, Any]],
+    authority: Optional[str],
+    output_dir: str,
+) -> None:
+    """Write one alert rules file per entity of the given kind."""
 
-        if client_enabled_alerts:
-            bridge_rules["groups"].append(
-                {
-                    "name": f"sui_bridge_client_enabled_alerts_{alias.replace(' ', '_')}",
-                    "rules": client_enabled_alerts,
-                }
-            )
+    # Create output directory if it doesn't exist
+    os.makedirs(output_dir, exist_ok=True)
 
-        # Write bridge-specific alert rules file
-        try:
-            with open(bridge_file, "w") as f:
-                yaml.dump(bridge_rules, f, default_flow_style=False, sort_keys=False)
+    # Results are reported in entity order to keep stderr ordered
+    results = _run_per_entity(_emit_entity_rules, entities, kind, authority, output_dir)
+    for entity, (rules_file, error) in zip(entities, results):
+        if error is not None:
             print(
-                f"Generated bridge-specific alert rules: {bridge_file}", file=sys.stderr
-            )
-        except Exception as e:
-            print(
-                f"ERROR: Failed to write bridge alert rules for {alias}: {e}",
+                f"ERROR: Failed to write {kind} alert rules for {entity['alias']}: "
+                f"{error}",
                 file=sys.stderr,
             )
             sys.exit(1)
+        print(f"Generated {kind}-specific alert rules: {rules_file}", file=sys.stderr)
+
+
+def generate_alert_rules(bridges: List[Dict[str, Any]], output_dir: str) -> None:
+    """Generate bridge-specific alert rules organized by bridge."""
+    _render_entity_rules("bridge", bridges, None, output_dir)
 
 
 def generate_fullnode_alert_rules(
     fullnodes: List[Dict[str, Any]], output_dir: str
 ) -> None:
     """Generate fullnode-specific alert rules organized by fullnode."""
-
-    import os
-
-    # Create output directory if it doesn't exist
-    os.makedirs(output_dir, exist_ok=True)
-
-    # Generate individual fullnode alert files
-    for i, fullnode in enumerate(fullnodes):
-        alias = fullnode["alias"]
-        alerts = fullnode.get("alerts", get_default_fullnode_alerts())
-
-        # Sanitize alias for filename
-        safe_alias = alias.lower().replace(" ", "_").replace("-", "_")
-        fullnode_file = os.path.join(
-            output_dir, f"sui_fullnode_{i}_{safe_alias}_alerts.yml"
-        )
-
-        fullnode_rules = {"groups": []}
-        critical_alerts = []
-
-        # Generate fullnode-specific alert rules based on enabled alerts
-        if alerts.get("uptime", False):
-            critical_alerts.append(
-                {
-                    "alert": f"SuiFullnode_Uptime_{alias.replace(' ', '_')}",
-                    "expr": f'rate(uptime{{alias="{alias}"}}[5m]) == 0',
-                    "for": "2m",
-                    "labels": {
-                        "severity": "critical",
-                        "service": "sui_fullnode",
-                        "instance": "{{ $labels.instance }}",
-                        "alias": f'"{alias}"',
-                        "alert_type": "uptime",
-                        "fullnode_index": str(i),
-                        "fullnode_alias": alias,
-                    },
-                    "annotations": {
-                        "summary": f"Fullnode Uptime Issue (Instance: {{{{ $labels.instance }}}}, Environment: {alias})",
-                        "description": f"The uptime for SUI Fullnode instance {{{{ $labels.instance }}}} ({alias}) is not increasing, suggesting a potential restart or failure.",
-                        "__dashboardUid__": "f3sdas8bbprlibnio2f0",
-                        "__panelId__": "347",
-                    },
-                }
-            )
-
-        if alerts.get("checkpoint_execution_rate", False):
-            critical_alerts.append(
-                {
-                    "alert": f"SuiFullnode_CheckpointExecutionRateLow_{alias.replace(' ', '_')}",
-                    "expr": f'rate(last_executed_checkpoint{{alias="{alias}"}}[5m]) < 2',
-                    "for": "5m",
-                    "labels": {
-                        "severity": "critical",
-                        "service": "sui_fullnode",
-                        "instance": "{{ $labels.instance }}",
-                        "alias": f'"{alias}"',
-                        "alert_type": "checkpoint_execution_rate",
-                        "fullnode_index": str(i),
-                        "fullnode_alias": alias,
-                    },
-                    "annotations": {
-                        "summary": f"Checkpoint Execution Rate Is Low (Instance: {{{{ $labels.instance }}}}, Environment: {alias})",
-                        "description": f"The checkpoint execution rate for SUI Fullnode instance {{{{ $labels.instance }}}} ({alias}) is below 2 checkpoints per second.",
-                        "__dashboardUid__": "f3sdas8bbprlibnio2f0",
-                        "__panelId__": "274",
-                    },
-                }
-            )
-
-        if alerts.get("checkpoint_sync_status", False):
-            critical_alerts.append(
-                {
-                    "alert": f"SuiFullnode_CheckpointSyncLow_{alias.replace(' ', '_')}",
-                    "expr": f'(last_executed_checkpoint{{alias="{alias}"}}/highest_synced_checkpoint{{alias="{alias}"}}) < 0.95',
-                    "for": "5m",
-                    "labels": {
-                        "severity": "critical",
-                        "service": "sui_fullnode",
-                        "instance": "{{ $labels.instance }}",
-                        "alias": f'"{alias}"',
-                        "alert_type": "checkpoint_sync_status",
-                        "fullnode_index": str(i),
-                        "fullnode_alias": alias,
-                    },
-                    "annotations": {
-                        "summary": f"Checkpoint Sync Status Low (Instance: {{{{ $labels.instance }}}}, Environment: {alias})",
-                        "description": f"The checkpoint sync ratio for SUI Fullnode instance {{{{ $labels.instance }}}} ({alias}) is below 95%, indicating the fullnode is falling behind.",
-                        "__dashboardUid__": "f3sdas8bbprlibnio2f0",
-                        "__panelId__": "280",
-                    },
-                }
-            )
-
-        # Add critical alerts group to fullnode rules
-        if critical_alerts:
-            fullnode_rules["groups"].append(
-                {
-                    "name": f"sui_fullnode_critical_alerts_{alias.replace(' ', '_')}",
-                    "rules": critical_alerts,
-                }
-            )
-
-        # Write fullnode-specific alert rules file
-        try:
-            with open(fullnode_file, "w") as f:
-                yaml.dump(fullnode_rules, f, default_flow_style=False, sort_keys=False)
-            print(
-                f"Generated fullnode-specific alert rules: {fullnode_file}",
-                file=sys.stderr,
-            )
-        except Exception as e:
-            print(
-                f"ERROR: Failed to write fullnode alert rules for {alias}: {e}",
-                file=sys.stderr,
-            )
-            sys.exit(1)
+    _render_entity_rules("fullnode", fullnodes, None, output_dir)
 
 
 def generate_validator_alert_rules(
     validators: List[Dict[str, Any]], authority: str, output_dir: str
 ) -> None:
     """Generate validator-specific alert rules organized by validator."""
+    _render_entity_rules("validator", validators, authority, output_dir)
 
-    import os
-
-    # Create output directory if it doesn't exist
-    os.makedirs(output_dir, exist_ok=True)
-
-    # Generate individual validator alert files
-    for i, validator in enumerate(validators):
-        alias = validator["alias"]
-        alerts = validator.get("alerts", get_default_validator_alerts())
-
-        # Sanitize alias for filename
-        safe_alias = alias.lower().replace(" ", "_").replace("-", "_")
-        validator_file = os.path.join(
-            output_dir, f"sui_validator_{i}_{safe_alias}_alerts.yml"
-        )
-
-        validator_rules = {"groups": []}
-        critical_alerts = []
-        warning_alerts = []
 
-        # Generate validator-specific alert rules based on enabled alerts
-        if alerts.get("uptime", False):
-            critical_alerts.append(
-                {
-                    "alert": f"SuiValidator_Uptime_{alias.replace(' ', '_')}",
-                    "expr": f'rate(uptime{{alias="{alias}"}}[5m]) == 0',
-                    "for": "2m",
-                    "labels": {
-                        "severity": "critical",
-                        "service": "sui_validator",
-                        "instance": "{{ $labels.instance }}",
-                        "alias": f'"{alias}"',
-                        "alert_type": "uptime",
-                        "validator_index": str(i),
-                        "validator_alias": alias,
-                    },
-                    "annotations": {
-                        "summary": f"Validator Uptime Issue (Instance: {{ $labels.instance }}, Environment: {alias})",
-                        "description": f"The uptime for SUI Validator instance {{ $labels.instance }} ({alias}) is not increasing, suggesting a potential restart or failure.",
-                        "__dashboardUid__": "d3sdas8bbprlibnio2n0",
-                        "__panelId__": "347",
-                    },
-                }
-            )
-
-        if alerts.get("reputation_rank", False):
-            warning_alerts.append(
-                {
-                    "alert": f"SuiValidator_ReputationRank_{alias.replace(' ', '_')}",
-                    "expr": f'(scalar(consensus_reputation_scores{{alias="{alias}", authority="{authority}"}}) <= bool max(bottomk(scalar(consensus_handler_num_low_scoring_authorities{{alias="{alias}"}}), consensus_reputation_scores{{alias="{alias}"}}))) == 1',
-                    "for": "30m",
-                    "labels": {
-                        "severity": "warning",
-                        "service": "sui_validator",
-                        "instance": "{{ $labels.instance }}",
-                        "alias": f'"{alias}"',
-                        "alert_type": "reputation_rank",
-                        "validator_index": str(i),
-                        "validator_alias": alias,
-                    },
-                    "annotations": {
-                        "summary": f"Validator Low Reputation Rank (Instance: {{ $labels.instance }}, Environment: {alias})",
-                        "description": f"The SUI Validator instance {{ $labels.instance }} ({alias}) is in the bottom N low-scoring validators based on consensus reputation scores.",
-                        "__dashboardUid__": "d3sdas8bbprlibnio2n0",
-                        "__panelId__": "366",
-                    },
-                }
-            )
+def _job_slug(alias: str) -> str:
+    """Lower-case an alias and replace spaces with underscores for job names."""
+    slug = alias.translate(_SLUG_TABLE)
+    # Non-ASCII letters are not in the table, so let str.lower() handle them
+    if slug and max(slug) > "\x7f":
+        return slug.lower()
+    return slug
 
-        if alerts.get("voting_power", False):
-            critical_alerts.append(
-                {
-                    "alert": f"SuiValidator_VotingPower_{alias.replace(' ', '_')}",
-                    "expr": f'current_voting_right{{alias="{alias}"}} == 0',
-                    "for": "5m",
-                    "labels": {
-                        "severity": "critical",
-                        "service": "sui_validator",
-                        "instance": "{{ $labels.instance }}",
-                        "alias": f'"{alias}"',
-                        "alert_type": "voting_power",
-                        "validator_index": str(i),
-                        "validator_alias": alias,
-                    },
-                    "annotations": {
-                        "summary": f"Zero Validator Voting Power (Instance: {{ $labels.instance }}, Environment: {alias})",
-                        "description": f"The SUI Validator instance {{ $labels.instance }} ({alias}) has zero voting power, indicating a critical issue with the validator's authority.",
-                        "__dashboardUid__": "d3sdas8bbprlibnio2n0",
-                        "__panelId__": "268",
-                    },
-                }
-            )
-
-        if alerts.get("tx_processing_latency_p95", False):
-            critical_alerts.append(
-                {
-                    "alert": f"SuiValidator_TxProcessingLatencyP95_{alias.replace(' ', '_')}",
-                    "expr": f'histogram_quantile(0.95, rate(validator_service_handle_certificate_consensus_latency_bucket{{alias="{alias}"}}[5m])) > 15000',
-                    "for": "5m",
-                    "labels": {
-                        "severity": "critical",
-                        "service": "sui_validator",
-                        "instance": "{{ $labels.instance }}",
-                        "alias": f'"{alias}"',
-                        "alert_type": "tx_processing_latency_p95",
-                        "validator_index": str(i),
-                        "validator_alias": alias,
-                    },
-                    "annotations": {
-                        "summary": f"High Transaction Processing Latency P95 (Instance: {{ $labels.instance }}, Environment: {alias})",
-                        "description": f"The 95th percentile transaction processing latency for SUI Validator instance {{ $labels.instance }} ({alias}) is above 15 seconds.",
-                        "__dashboardUid__": "d3sdas8bbprlibnio2n0",
-                        "__panelId__": "295",
-                    },
-                }
-            )
-
-        if alerts.get("tx_processing_latency_p95_10s", False):
-            warning_alerts.append(
-                {
-                    "alert": f"SuiValidator_TxProcessingLatencyP95_10s_{alias.replace(' ', '_')}",
-                    "expr": f'histogram_quantile(0.95, rate(validator_service_handle_certificate_consensus_latency_bucket{{alias="{alias}"}}[5m])) > 10000',
-                    "for": "5m",
-                    "labels": {
-                        "severity": "warning",
-                        "service": "sui_validator",
-                        "instance": "{{ $labels.instance }}",
-                        "alias": f'"{alias}"',
-                        "alert_type": "tx_processing_latency_p95_10s",
-                        "validator_index": str(i),
-                        "validator_alias": alias,
-                    },
-                    "annotations": {
-                        "summary": f"Elevated Transaction Processing Latency P95 (Instance: {{ $labels.instance }}, Environment: {alias})",
-                        "description": f"The 95th percentile transaction processing latency for SUI Validator instance {{ $labels.instance }} ({alias}) is above 10 seconds.",
-                        "__dashboardUid__": "d3sdas8bbprlibnio2n0",
-                        "__panelId__": "295",
-                    },
-                }
-            )
-
-        if alerts.get("tx_processing_latency_p95_3s", False):
-            warning_alerts.append(
-                {
-                    "alert": f"SuiValidator_TxProcessingLatencyP95_3s_{alias.replace(' ', '_')}",
-                    "expr": f'histogram_quantile(0.95, rate(validator_service_handle_certificate_consensus_latency_bucket{{alias="{alias}"}}[5m])) > 3000',
-                    "for": "5m",
-                    "labels": {
-                        "severity": "warning",
-                        "service": "sui_validator",
-                        "instance": "{{ $labels.instance }}",
-                        "alias": f'"{alias}"',
-                        "alert_type": "tx_processing_latency_p95_3s",
-                        "validator_index": str(i),
-                        "validator_alias": alias,
-                    },
-                    "annotations": {
-                        "summary": f"Moderate Transaction Processing Latency P95 (Instance: {{ $labels.instance }}, Environment: {alias})",
-                        "description": f"The 95th percentile transaction processing latency for SUI Validator instance {{ $labels.instance }} ({alias}) is above 3 seconds.",
-                        "__dashboardUid__": "d3sdas8bbprlibnio2n0",
-                        "__panelId__": "295",
-                    },
-                }
-            )
 
-        if alerts.get("tx_processing_latency_p50", False):
-            critical_alerts.append(
-                {
-                    "alert": f"SuiValidator_TxProcessingLatencyP50_{alias.replace(' ', '_')}",
-                    "expr": f'histogram_quantile(0.50, rate(validator_service_handle_certificate_consensus_latency_bucket{{alias="{alias}"}}[5m])) > 5000',
-                    "for": "5m",
-                    "labels": {
-                        "severity": "critical",
-                        "service": "sui_validator",
-                        "instance": "{{ $labels.instance }}",
-                        "alias": f'"{alias}"',
-                        "alert_type": "tx_processing_latency_p50",
-                        "validator_index": str(i),
-                        "validator_alias": alias,
-                    },
-                    "annotations": {
-                        "summary": f"High Transaction Processing Latency P50 (Instance: {{ $labels.instance }}, Environment: {alias})",
-                        "description": f"The 50th percentile transaction processing latency for SUI Validator instance {{ $labels.instance }} ({alias}) is above 5 seconds.",
-                        "__dashboardUid__": "d3sdas8bbprlibnio2n0",
-                        "__panelId__": "295",
-                    },
-                }
-            )
+def _split_target(target: str) -> Tuple[str, str]:
+    """Split a scrape target into its scheme and scheme-less address."""
+    # Bare host:port targets default to http; a trailing slash (as in a pasted
+    # "https://host:port/") is not part of the address
+    parts = urlsplit(target if "://" in target else "http://" + target)
+    return parts.scheme or "http", parts.netloc + parts.path.rstrip("/")
 
-        if alerts.get("proposal_latency", False):
-            critical_alerts.append(
-                {
-                    "alert": f"SuiValidator_ProposalLatency_{alias.replace(' ', '_')}",
-                    "expr": f'rate(consensus_quorum_receive_latency_sum{{alias="{alias}"}}[5m]) / rate(consensus_quorum_receive_latency_count{{alias="{alias}"}}[5m]) > 2',
-                    "for": "5m",
-                    "labels": {
-                        "severity": "critical",
-                        "service": "sui_validator",
-                        "instance": "{{ $labels.instance }}",
-                        "alias": f'"{alias}"',
-                        "alert_type": "proposal_latency",
-                        "validator_index": str(i),
-                        "validator_alias": alias,
-                    },
-                    "annotations": {
-                        "summary": f"High Consensus Proposal Latency (Instance: {{ $labels.instance }}, Environment: {alias})",
-                        "description": f"The consensus proposal latency for SUI Validator instance {{ $labels.instance }} ({alias}) is above 2 seconds.",
-                        "__dashboardUid__": "d3sdas8bbprlibnio2n0",
-                        "__panelId__": "342",
-                    },
-                }
-            )
 
-        if alerts.get("consensus_proposals_rate", False):
-            critical_alerts.append(
-                {
-                    "alert": f"SuiValidator_ConsensusProposalsRate_{alias.replace(' ', '_')}",
-                    "expr": f'sum(rate(consensus_proposed_blocks{{alias="{alias}", force="false"}}[5m])) + sum(rate(consensus_proposed_blocks{{alias="{alias}", force="true"}}[5m])) < 3',
-                    "for": "5m",
-                    "labels": {
-                        "severity": "critical",
-                        "service": "sui_validator",
-                        "instance": "{{ $labels.instance }}",
-                        "alias": f'"{alias}"',
-                        "alert_type": "consensus_proposals_rate",
-                        "validator_index": str(i),
-                        "validator_alias": alias,
-                    },
-                    "annotations": {
-                        "summary": f"Low Consensus Proposals Rate (Instance: {{ $labels.instance }}, Environment: {alias})",
-                        "description": f"The consensus proposals rate for SUI Validator instance {{ $labels.instance }} ({alias}) is below 3 blocks per second.",
-                        "__dashboardUid__": "d3sdas8bbprlibnio2n0",
-                        "__panelId__": "295",
-                    },
-                }
-            )
+def _scrape_labels(service: str, alias: str) -> Dict[str, str]:
+    """Build the static labels attached to every configured target."""
+    return {"service": service, "alias": alias, "configured": "true"}
 
-        if alerts.get("safe_mode", False):
-            critical_alerts.append(
-                {
-                    "alert": f"SuiValidator_SafeMode_{alias.replace(' ', '_')}",
-                    "expr": f'is_safe_mode{{alias="{alias}"}} > 0.5 or absent(is_safe_mode{{alias="{alias}"}})',
-                    "for": "5m",
-                    "labels": {
-                        "severity": "critical",
-                        "service": "sui_validator",
-                        "instance": "{{ $labels.instance }}",
-                        "alias": f'"{alias}"',
-                        "alert_type": "safe_mode",
-                        "validator_index": str(i),
-                        "validator_alias": alias,
-                    },
-                    "annotations": {
-                        "summary": f"Safe Mode during Reconfiguration (Instance: {{ $labels.instance }}, Environment: {alias})",
-                        "description": f"Epoch failed to advance; chain entered safe mode for SUI Validator instance {{ $labels.instance }} ({alias}).",
-                        "__dashboardUid__": "d3sdas8bbprlibnio2n0",
-                        "__panelId__": "256",
-                    },
-                }
-            )
 
-        if alerts.get("randomness_dkg_failure", False):
-            critical_alerts.append(
-                {
-                    "alert": f"SuiValidator_RandomnessBeaconDKGFailed_{alias.replace(' ', '_')}",
-                    "expr": f'epoch_random_beacon_dkg_failed{{alias="{alias}"}} > 0 or absent(epoch_random_beacon_dkg_failed{{alias="{alias}"}})',
-                    "for": "5m",
-                    "labels": {
-                        "severity": "critical",
-                        "service": "sui_validator",
-                        "instance": "{{ $labels.instance }}",
-                        "alias": f'"{alias}"',
-                        "alert_type": "randomness_dkg_failure",
-                        "validator_index": str(i),
-                        "validator_alias": alias,
-                    },
-                    "annotations": {
-                        "summary": f"Randomness DKG Failure (Instance: {{ $labels.instance }}, Environment: {alias})",
-                        "description": f"Random beacon DKG has failed on one or more hosts for SUI Validator instance {{ $labels.instance }} ({alias}).",
-                        "__dashboardUid__": "d3sdas8bbprlibnio2n0",
-                        "__panelId__": "400",
-                    },
-                }
-            )
+def _metrics_job(
+    job_name: str, target: str, service: str, alias: str, scheme: str
+) -> Dict[str, Any]:
+    """Build a direct /metrics scrape job for one target."""
+    return {
+        "job_name": job_name,
+        "static_configs": [
+            {"targets": [target], "labels": _scrape_labels(service, alias)}
+        ],
+        **_SCRAPE_DEFAULTS,
+        "scheme": scheme,
+        "honor_labels": True,
+    }
 
-        if alerts.get("checkpoint_execution_rate", False):
-            critical_alerts.append(
-                {
-                    "alert": f"SuiValidator_CheckpointExecutionRateLow_{alias.replace(' ', '_')}",
-                    "expr": f'rate(last_executed_checkpoint{{alias="{alias}"}}[5m]) < 2',
-                    "for": "5m",
-                    "labels": {
-                        "severity": "critical",
-                        "service": "sui_validator",
-                        "instance": "{{ $labels.instance }}",
-                        "alias": f'"{alias}"',
-                        "alert_type": "checkpoint_execution_rate",
-                        "validator_index": str(i),
-                        "validator_alias": alias,
-                    },
-                    "annotations": {
-                        "summary": f"Checkpoint Execution Rate Is Low (Instance: {{ $labels.instance }}, Environment: {alias})",
-                        "description": f"The checkpoint execution rate for SUI Validator instance {{ $labels.instance }} ({alias}) is below 2 checkpoints per second.",
-                        "__dashboardUid__": "d3sdas8bbprlibnio2n0",
-                        "__panelId__": "274",
-                    },
-                }
-            )
 
-        if alerts.get("committed_round_rate", False):
-            critical_alerts.append(
-                {
-                    "alert": f"SuiValidator_CommittedRoundRate_{alias.replace(' ', '_')}",
-                    "expr": f'rate(consensus_last_committed_leader_round{{alias="{alias}"}}[2m]) < 3',
-                    "for": "5m",
-                    "labels": {
-                        "severity": "critical",
-                        "service": "sui_validator",
-                        "instance": "{{ $labels.instance }}",
-                        "alias": f'"{alias}"',
-                        "alert_type": "committed_round_rate",
-                        "validator_index": str(i),
-                        "validator_alias": alias,
-                    },
-                    "annotations": {
-                        "summary": f"Low Committed Round Rate (Instance: {{ $labels.instance }}, Environment: {alias})",
-                        "description": f"The committed round rate for SUI Validator instance {{ $labels.instance }} ({alias}) is below 3 rounds per second.",
-                        "__dashboardUid__": "d3sdas8bbprlibnio2n0",
-                        "__panelId__": "241",
-                    },
-                }
-            )
+def _probe_job(
+    job_name: str,
+    target: str,
+    service: str,
+    alias: str,
+    instance_relabel: Dict[str, str],
+) -> Dict[str, Any]:
+    """Build a blackbox exporter HTTP probe job for one target."""
+    return {
+        "job_name": job_name,
+        "metrics_path": "/probe",
+        "params": _PROBE_PARAMS,
+        "static_configs": [
+            {"targets": [target], "labels": _scrape_labels(service, alias)}
+        ],
+        "scrape_interval": "1m",
+        "scrape_timeout": "10s",
+        "relabel_configs": [_RELABEL_SOURCE, instance_relabel, _RELABEL_BLACKBOX],
+    }
 
-        if alerts.get("fullnode_connectivity", False):
-            critical_alerts.append(
-                {
-                    "alert": f"SuiValidator_FullnodeConnectivity_{alias.replace(' ', '_')}",
-                    "expr": f'rate(total_rpc_err{{alias="{alias}", name="{authority}"}}[2m]) > 0',
-                    "for": "5m",
-                    "labels": {
-                        "severity": "critical",
-                        "service": "sui_validator",
-                        "instance": "{{ $labels.instance }}",
-                        "alias": f'"{alias}"',
-                        "alert_type": "fullnode_connectivity",
-                        "validator_index": str(i),
-                        "validator_alias": alias,
-                    },
-                    "annotations": {
-                        "summary": f"Fullnode Connectivity Issues (Instance: {{ $labels.instance }}, Environment: {alias})",
-                        "description": f"The SUI Validator instance {{ $labels.instance }} ({alias}) is experiencing RPC errors indicating connectivity issues with fullnodes.",
-                        "__dashboardUid__": "d3sdas8bbprlibnio2n0",
-                        "__panelId__": "390",
-                    },
-                }
-            )
 
-        if alerts.get("sequencing_latency_high", False):
-            warning_alerts.append(
-                {
-                    "alert": f"SuiValidator_SequencingLatencyHigh_{alias.replace(' ', '_')}",
-                    "expr": f'histogram_quantile(0.99, sum by(le) (rate(sequencing_certificate_latency_bucket{{alias="{alias}", position="0", tx_type=~"shared_certificate|owned_certificate|soft_bundle"}}[2m]))) > 10',
-                    "for": "1m",
-                    "labels": {
-                        "severity": "warning",
-                        "service": "sui_validator",
-                        "instance": "{{ $labels.instance }}",
-                        "alias": f'"{alias}"',
-                        "alert_type": "sequencing_latency",
-                        "validator_index": str(i),
-                        "validator_alias": alias,
-                    },
-                    "annotations": {
-                        "summary": f"Consensus Sequencing p99 Latencies are High (Instance: {{ $labels.instance }}, Environment: {alias})",
-                        "description": f"Consensus sequencing latency is too high for SUI Validator instance {{ $labels.instance }} ({alias}).",
-                        "__dashboardUid__": "d3sdas8bbprlibnio2n0",
-                        "__panelId__": "258",
-                    },
-                }
-            )
+def _bridge_jobs(
+    bridge: Dict[str, Any]
+) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+    """Build the metrics, public key check and ingress check jobs for a bridge."""
+    alias = bridge["alias"]
+    target = bridge["target"]
+    public_address = bridge["public_address"]
+    alias_slug = _job_slug(alias)
+
+    # Sanitize target for scheme detection
+    scheme, clean_target = _split_target(target)
+
+    # Bridge metrics scrape config
+    bridge_job = _metrics_job(
+        f"sui_bridge_{alias_slug}", clean_target, "sui_bridge", alias, scheme
+    )
+    bridge_job["relabel_configs"] = [
+        {"target_label": "instance", "replacement": clean_target}
+    ]
+
+    # Blackbox probe relabeling; only the instance rule varies per bridge
+    instance_relabel = {
+        "source_labels": ["__param_target"],
+        "target_label": "instance",
+        "replacement": clean_target,
+    }
 
-        # Add critical alerts group to validator rules
-        if critical_alerts:
-            validator_rules["groups"].append(
-                {
-                    "name": f"sui_validator_critical_alerts_{alias.replace(' ', '_')}",
-                    "rules": critical_alerts,
-                }
-            )
+    # Bridge health check config
+    health_job = _probe_job(
+        f"sui_bridge_{alias_slug}_metrics_public_key_check",
+        f"{public_address}/metrics_pub_key",
+        "sui_bridge_health_check",
+        alias,
+        instance_relabel,
+    )
 
-        # Add warning alerts group to validator rules
-        if warning_alerts:
-            validator_rules["groups"].append(
-                {
-                    "name": f"sui_validator_warning_alerts_{alias.replace(' ', '_')}",
-                    "rules": warning_alerts,
-                }
-            )
+    # Bridge ingress check config
+    ingress_job = _probe_job(
+        f"sui_bridge_{alias_slug}_ingress_check",
+        public_address,
+        "sui_bridge_ingress_check",
+        alias,
+        instance_relabel,
+    )
 
-        # Write validator-specific alert rules file
-        try:
-            with open(validator_file, "w") as f:
-                yaml.dump(validator_rules, f, default_flow_style=False, sort_keys=False)
-            print(
-                f"Generated validator-specific alert rules: {validator_file}",
-                file=sys.stderr,
-            )
-        except Exception as e:
-            print(
-                f"ERROR: Failed to write validator alert rules for {alias}: {e}",
-                file=sys.stderr,
-            )
-            sys.exit(1)
+    return bridge_job, health_job, ingress_job
 
 
 def generate_prometheus_config(
     bridges: List[Dict[str, Any]], 
     validators: List[Dict[str, Any]], 
     fullnodes: List[Dict[str, Any]],
-    output_file: str
+    output_file: str,
+    input_digest: Optional[bytes] = None,
 ) -> None:
-    """Generate Prometheus configuration file."""
+    """Generate Prometheus configuration file.
 
-    # Base Prometheus configuration
-    prometheus_config = {
-        "global": {
-            "scrape_interval": "15s",
-            "evaluation_interval": "15s",
-            "external_labels": {"cluster": "sui-monitoring", "replica": "prometheus-1"},
-        },
-        "rule_files": ["/etc/prometheus/rules/*.yml"],
-        "alerting": {
-            "alertmanagers": [
-                {"static_configs": [{"targets": ["${ALERTMANAGER_TARGET}"]}]}
-            ]
-        },
-        "scrape_configs": [
-            {
-                "job_name": "prometheus",
-                "static_configs": [{"targets": ["${PROMETHEUS_TARGET}"]}],
-                "scrape_interval": "5s",
-                "metrics_path": "/metrics",
-            }
-        ],
-    }
-
-    # Add bridge scrape configs
-    for bridge in bridges:
-        alias = bridge["alias"]
-        target = bridge["target"]
-        public_address = bridge["public_address"]
+    When input_digest is given and matches the digest recorded next to an
+    existing output_file, the file is left as is.
+    """
 
-        # Sanitize target for scheme detection
-        scheme = "http"
-        clean_target = target
-        if target.startswith("https://"):
-            scheme = "https"
-            clean_target = target[8:]
-        elif target.startswith("http://"):
-            scheme = "http"
-            clean_target = target[7:]
-
-        # Bridge metrics scrape config
-        bridge_job = {
-            "job_name": f'sui_bridge_{alias.lower().replace(" ", "_")}',
-            "static_configs": [
-                {
-                    "targets": [clean_target],
-                    "labels": {
-                        "service": "sui_bridge",
-                        "alias": alias,
-                        "configured": "true",
-                    },
-                }
-            ],
-            "scrape_interval": "15s",
-            "metrics_path": "/metrics",
-            "scrape_timeout": "10s",
-            "scheme": scheme,
-            "honor_labels": True,
-            "relabel_configs": [
-                {"target_label": "instance", "replacement": clean_target}
-            ],
-        }
-        prometheus_config["scrape_configs"].append(bridge_job)
-
-        # Bridge health check config
-        health_job = {
-            "job_name": f'sui_bridge_{alias.lower().replace(" ", "_")}_metrics_public_key_check',
-            "metrics_path": "/probe",
-            "params": {"module": ["http_2xx"]},
-            "static_configs": [
-                {
-                    "targets": [f"{public_address}/metrics_pub_key"],
-                    "labels": {
-                        "service": "sui_bridge_health_check",
-                        "alias": alias,
-                        "configured": "true",
-                    },
-                }
-            ],
-            "scrape_interval": "1m",
-            "scrape_timeout": "10s",
-            "relabel_configs": [
-                {"source_labels": ["__address__"], "target_label": "__param_target"},
-                {
-                    "source_labels": ["__param_target"],
-                    "target_label": "instance",
-                    "replacement": clean_target,
-                },
-                {
-                    "target_label": "__address__",
-                    "replacement": "${BLACKBOX_EXPORTER_ADDRESS}",
-                },
-            ],
-        }
-        prometheus_config["scrape_configs"].append(health_job)
-
-        # Bridge ingress check config
-        ingress_job = {
-            "job_name": f'sui_bridge_{alias.lower().replace(" ", "_")}_ingress_check',
-            "metrics_path": "/probe",
-            "params": {"module": ["http_2xx"]},
-            "static_configs": [
-                {
-                    "targets": [public_address],
-                    "labels": {
-                        "service": "sui_bridge_ingress_check",
-                        "alias": alias,
-                        "configured": "true",
-                    },
-                }
-            ],
-            "scrape_interval": "1m",
-            "scrape_timeout": "10s",
-            "relabel_configs": [
-                {"source_labels": ["__address__"], "target_label": "__param_target"},
-                {
-                    "source_labels": ["__param_target"],
-                    "target_label": "instance",
-                    "replacement": clean_target,
-                },
-                {
-                    "target_label": "__address__",
-                    "replacement": "${BLACKBOX_EXPORTER_ADDRESS}",
-                },
-            ],
-        }
-        prometheus_config["scrape_configs"].append(ingress_job)
+    digest_file = f"{output_file}{DIGEST_SUFFIX}"
+    if input_digest is not None and os.path.exists(output_file):
+        try:
+            with open(digest_file, "rb") as f:
+                if f.read() == input_digest:
+                    print(
+                        f"Prometheus configuration unchanged: {output_file}",
+                        file=sys.stderr,
+                    )
+                    return
+        except OSError:
+            pass
+
+    # Add bridge scrape configs; a few microseconds of dict building per
+    # bridge, so a worker pool would only add startup and pickling cost
+    scrape_configs = [job for bridge in bridges for job in _bridge_jobs(bridge)]
 
     # Add validator scrape configs
     for validator in validators:
@@ -1293,35 +1180,18 @@ def generate_prometheus_config(
         target = validator["target"]
 
         # Sanitize target for scheme detection
-        scheme = "http"
-        clean_target = target
-        if target.startswith("https://"):
-            scheme = "https"
-            clean_target = target[8:]
-        elif target.startswith("http://"):
-            scheme = "http"
-            clean_target = target[7:]
+        scheme, clean_target = _split_target(target)
 
         # Validator metrics scrape config
-        validator_job = {
-            "job_name": f'sui_validator_{alias.lower().replace(" ", "_")}',
-            "static_configs": [
-                {
-                    "targets": [clean_target],
-                    "labels": {
-                        "service": "sui_validator",
-                        "alias": alias,
-                        "configured": "true",
-                    },
-                }
-            ],
-            "scrape_interval": "15s",
-            "metrics_path": "/metrics",
-            "scrape_timeout": "10s",
-            "scheme": scheme,
-            "honor_labels": True,
-        }
-        prometheus_config["scrape_configs"].append(validator_job)
+        scrape_configs.append(
+            _metrics_job(
+                f"sui_validator_{_job_slug(alias)}",
+                clean_target,
+                "sui_validator",
+                alias,
+                scheme,
+            )
+        )
 
     # Add fullnode scrape configs
     for fullnode in fullnodes:
@@ -1329,46 +1199,81 @@ def generate_prometheus_config(
         target = fullnode["target"]
 
         # Sanitize target for scheme detection
-        scheme = "http"
-        clean_target = target
-        if target.startswith("https://"):
-            scheme = "https"
-            clean_target = target[8:]
-        elif target.startswith("http://"):
-            scheme = "http"
-            clean_target = target[7:]
+        scheme, clean_target = _split_target(target)
 
         # Fullnode metrics scrape config
-        fullnode_job = {
-            "job_name": f'sui_fullnode_{alias.lower().replace(" ", "_")}',
-            "static_configs": [
-                {
-                    "targets": [clean_target],
-                    "labels": {
-                        "service": "sui_fullnode",
-                        "alias": alias,
-                        "configured": "true",
-                    },
-                }
-            ],
-            "scrape_interval": "15s",
-            "metrics_path": "/metrics",
-            "scrape_timeout": "10s",
-            "scheme": scheme,
-            "honor_labels": True,
-        }
-        prometheus_config["scrape_configs"].append(fullnode_job)
+        scrape_configs.append(
+            _metrics_job(
+                f"sui_fullnode_{_job_slug(alias)}",
+                clean_target,
+                "sui_fullnode",
+                alias,
+                scheme,
+            )
+        )
 
     # Write configuration file
     try:
-        with open(output_file, "w") as f:
-            yaml.dump(prometheus_config, f, default_flow_style=False, sort_keys=False)
+        if _json_output():
+            # JSON is a subset of YAML, so Prometheus loads this unchanged
+            prometheus_config = dict(_PROMETHEUS_BASE)
+            prometheus_config["scrape_configs"] = (
+                _PROMETHEUS_BASE["scrape_configs"] + scrape_configs
+            )
+            data = _dumps_json(prometheus_config)
+        else:
+            # Only the generated jobs go through the emitter; they are appended
+            # to the pre-rendered base as items of its scrape_configs sequence
+            data = _PROMETHEUS_BASE_YAML
+            if scrape_configs:
+                data += _dump_yaml(scrape_configs)
+        # Drop the old digest first so a failed write is never treated as current
+        if os.path.exists(digest_file):
+            os.remove(digest_file)
+        with open(output_file, "wb") as f:
+            f.write(data)
+        if input_digest is not None:
+            with open(digest_file, "wb") as f:
+                f.write(input_digest)
         print(f"Generated Prometheus configuration: {output_file}", file=sys.stderr)
     except Exception as e:
         print(f"ERROR: Failed to write Prometheus config: {e}", file=sys.stderr)
         sys.exit(1)
 
 
+# Alertmanager notification templates; the {{ }} fields are Go templates
+# filled in by Alertmanager
+_PAGERDUTY_DESCRIPTION = (
+    "{{ .GroupLabels.alertname }} - {{ .CommonAnnotations.summary }}"
+)
+_PAGERDUTY_DETAILS = {
+    "severity": "{{ .CommonLabels.severity }}",
+    "alertname": "{{ .GroupLabels.alertname }}",
+    "service": "{{ .CommonLabels.service }}",
+    "instance": "{{ .CommonLabels.instance }}",
+    "summary": "{{ .CommonAnnotations.summary }}",
+    "description": "{{ .CommonAnnotations.description }}",
+}
+_TELEGRAM_MESSAGE = "<b>{heading}</b>\n\n<b>Alert:</b> {{{{ .GroupLabels.alertname }}}}\n<b>Service:</b> {{{{ .CommonLabels.service }}}}\n<b>Instance:</b> {{{{ .CommonLabels.instance }}}}\n<b>Severity:</b> {{{{ .CommonLabels.severity }}}}\n\n<b>Summary:</b> {{{{ .CommonAnnotations.summary }}}}\n\n<b>Description:</b> {{{{ .CommonAnnotations.description }}}}"
+_DISCORD_TITLE = "{heading}: {{{{ .GroupLabels.alertname }}}}"
+_DISCORD_MESSAGE = "**Service:** {{ .CommonLabels.service }}\n**Instance:** {{ .CommonLabels.instance }}\n**Severity:** {{ .CommonLabels.severity }}\n\n**Summary:** {{ .CommonAnnotations.summary }}\n\n**Description:** {{ .CommonAnnotations.description }}"
+
+# Alertmanager receivers per severity as (receiver name, Telegram message,
+# Discord title, whether PagerDuty is paged)
+ALERT_RECEIVER_LEVELS = tuple(
+    (
+        name,
+        _TELEGRAM_MESSAGE.format(heading=heading),
+        _DISCORD_TITLE.format(heading=heading),
+        pages,
+    )
+    for name, heading, pages in (
+        ("critical", "🚨 CRITICAL Alert", True),
+        ("warning", "⚠️ WARNING Alert", False),
+    )
+)
+
+
 def generate_alertmanager_config(config: Dict[str, Any], output_file: str) -> None:
     """Generate Alertmanager configuration file with dynamic notification receivers."""
 
@@ -1441,92 +1346,53 @@ def generate_alertmanager_config(config: Dict[str, Any], output_file: str) -> No
         ],
     }
 
-    # Build critical receiver
-    critical_receiver = {
-        "name": "critical",
-        "webhook_configs": [
-            {"url": f"http://localhost:{webhook_port}", "send_resolved": True}
-        ],
-    }
-
-    if has_pagerduty:
-        critical_receiver["pagerduty_configs"] = [
-            {
-                "routing_key": pagerduty_key,
-                "send_resolved": True,
-                "description": "{{ .GroupLabels.alertname }} - {{ .CommonAnnotations.summary }}",
-                "details": {
-                    "severity": "{{ .CommonLabels.severity }}",
-                    "alertname": "{{ .GroupLabels.alertname }}",
-                    "service": "{{ .CommonLabels.service }}",
-                    "instance": "{{ .CommonLabels.instance }}",
-                    "summary": "{{ .CommonAnnotations.summary }}",
-                    "description": "{{ .CommonAnnotations.description }}",
-                },
-                "severity": "critical",
-            }
-        ]
-
-    if has_telegram:
-        critical_receiver["telegram_configs"] = [
-            {
-                "api_url": "https://api.telegram.org",
-                "bot_token": telegram_bot_token,
-                "chat_id": telegram_chat_id_int,
-                "send_resolved": True,
-                "parse_mode": "HTML",
-                "message": "<b>🚨 CRITICAL Alert</b>\n\n<b>Alert:</b> {{ .GroupLabels.alertname }}\n<b>Service:</b> {{ .CommonLabels.service }}\n<b>Instance:</b> {{ .CommonLabels.instance }}\n<b>Severity:</b> {{ .CommonLabels.severity }}\n\n<b>Summary:</b> {{ .CommonAnnotations.summary }}\n\n<b>Description:</b> {{ .CommonAnnotations.description }}",
-            }
-        ]
-
-    if has_discord:
-        critical_receiver["discord_configs"] = [
-            {
-                "webhook_url": discord_webhook_url,
-                "send_resolved": True,
-                "title": "🚨 CRITICAL Alert: {{ .GroupLabels.alertname }}",
-                "message": "**Service:** {{ .CommonLabels.service }}\n**Instance:** {{ .CommonLabels.instance }}\n**Severity:** {{ .CommonLabels.severity }}\n\n**Summary:** {{ .CommonAnnotations.summary }}\n\n**Description:** {{ .CommonAnnotations.description }}",
-            }
-        ]
+    # Build one receiver per severity; only critical alerts page PagerDuty
+    for name, telegram_message, discord_title, pages in ALERT_RECEIVER_LEVELS:
+        receiver = {
+            "name": name,
+            "webhook_configs": [
+                {"url": f"http://localhost:{webhook_port}", "send_resolved": True}
+            ],
+        }
 
-    # Build warning receiver
-    warning_receiver = {
-        "name": "warning",
-        "webhook_configs": [
-            {"url": f"http://localhost:{webhook_port}", "send_resolved": True}
-        ],
-    }
+        if pages and has_pagerduty:
+            receiver["pagerduty_configs"] = [
+                {
+                    "routing_key": pagerduty_key,
+                    "send_resolved": True,
+                    "description": _PAGERDUTY_DESCRIPTION,
+                    "details": _PAGERDUTY_DETAILS,
+                    "severity": "critical",
+                }
+            ]
 
-    if has_telegram:
-        warning_receiver["telegram_configs"] = [
-            {
-                "api_url": "https://api.telegram.org",
-                "bot_token": telegram_bot_token,
-                "chat_id": telegram_chat_id_int,
-                "send_resolved": True,
-                "parse_mode": "HTML",
-                "message": "<b>⚠️ WARNING Alert</b>\n\n<b>Alert:</b> {{ .GroupLabels.alertname }}\n<b>Service:</b> {{ .CommonLabels.service }}\n<b>Instance:</b> {{ .CommonLabels.instance }}\n<b>Severity:</b> {{ .CommonLabels.severity }}\n\n<b>Summary:</b> {{ .CommonAnnotations.summary }}\n\n<b>Description:</b> {{ .CommonAnnotations.description }}",
-            }
-        ]
+        if has_telegram:
+            receiver["telegram_configs"] = [
+                {
+                    "api_url": "https://api.telegram.org",
+                    "bot_token": telegram_bot_token,
+                    "chat_id": telegram_chat_id_int,
+                    "send_resolved": True,
+                    "parse_mode": "HTML",
+                    "message": telegram_message,
+                }
+            ]
 
-    if has_discord:
-        warning_receiver["discord_configs"] = [
-            {
-                "webhook_url": discord_webhook_url,
-                "send_resolved": True,
-                "title": "⚠️ WARNING Alert: {{ .GroupLabels.alertname }}",
-                "message": "**Service:** {{ .CommonLabels.service }}\n**Instance:** {{ .CommonLabels.instance }}\n**Severity:** {{ .CommonLabels.severity }}\n\n**Summary:** {{ .CommonAnnotations.summary }}\n\n**Description:** {{ .CommonAnnotations.description }}",
-            }
-        ]
+        if has_discord:
+            receiver["discord_configs"] = [
+                {
+                    "webhook_url": discord_webhook_url,
+                    "send_resolved": True,
+                    "title": discord_title,
+                    "message": _DISCORD_MESSAGE,
+                }
+            ]
 
-    # Add receivers to config
-    alertmanager_config["receivers"].append(critical_receiver)
-    alertmanager_config["receivers"].append(warning_receiver)
+        alertmanager_config["receivers"].append(receiver)
 
     # Write configuration file
     try:
-        with open(output_file, "w") as f:
-            yaml.dump(alertmanager_config, f, default_flow_style=False, sort_keys=False)
+        _write_yaml(alertmanager_config, output_file)
 
         # Log which notification services are configured
         notification_services = []
@@ -1551,55 +1417,73 @@ def generate_alertmanager_config(config: Dict[str, Any], output_file: str) -> No
         sys.exit(1)
 
 
+def _write_lines(lines: List[str]) -> None:
+    """Emit export lines to stdout with a single write."""
+    sys.stdout.write("\n".join(lines))
+    sys.stdout.write("\n")
+
+
 def export_validator_variables(validators: List[Dict[str, Any]]) -> None:
     """Export validator configuration as shell environment variables."""
-    print("# Validator configuration variables")
-    print(f"export SUI_VALIDATORS_COUNT={len(validators)}")
+    lines = [
+        "# Validator configuration variables",
+        f"export SUI_VALIDATORS_COUNT={len(validators)}",
+    ]
 
     for i, validator in enumerate(validators):
         alias = validator["alias"]
         target = validator["target"]
 
         # Export individual validator variables
-        print(f"export SUI_VALIDATOR_{i}_ALIAS='{alias}'")
-        print(f"export SUI_VALIDATOR_{i}_TARGET='{target}'")
+        lines.extend(
+            (
+                f"export SUI_VALIDATOR_{i}_ALIAS='{alias}'",
+                f"export SUI_VALIDATOR_{i}_TARGET='{target}'",
+            )
+        )
 
     # Export as JSON for complex parsing - write to separate file to avoid shell parsing issues
-    validators_json = json.dumps(validators, indent=2)
-    print(f"export SUI_VALIDATORS_CONFIG_FILE='generated_configs/validators.json'")
+    lines.append(f"export SUI_VALIDATORS_CONFIG_FILE='generated_configs/validators.json'")
+    _write_lines(lines)
 
     # Write JSON to file
-    with open("generated_configs/validators.json", "w") as f:
-        f.write(validators_json)
+    _write_json(validators, "generated_configs/validators.json")
 
 
 def export_fullnode_variables(fullnodes: List[Dict[str, Any]]) -> None:
     """Export fullnode configuration as shell environment variables."""
-    print("# Fullnode configuration variables")
-    print(f"export SUI_FULLNODES_COUNT={len(fullnodes)}")
+    lines = [
+        "# Fullnode configuration variables",
+        f"export SUI_FULLNODES_COUNT={len(fullnodes)}",
+    ]
 
     for i, fullnode in enumerate(fullnodes):
         alias = fullnode["alias"]
         target = fullnode["target"]
 
         # Export individual fullnode variables
-        print(f"export SUI_FULLNODE_{i}_ALIAS='{alias}'")
-        print(f"export SUI_FULLNODE_{i}_TARGET='{target}'")
+        lines.extend(
+            (
+                f"export SUI_FULLNODE_{i}_ALIAS='{alias}'",
+                f"export SUI_FULLNODE_{i}_TARGET='{target}'",
+            )
+        )
 
     # Export as JSON for complex parsing - write to separate file to avoid shell parsing issues
-    fullnodes_json = json.dumps(fullnodes, indent=2)
-    print(f"export SUI_FULLNODES_CONFIG_FILE='generated_configs/fullnodes.json'")
+    lines.append(f"export SUI_FULLNODES_CONFIG_FILE='generated_configs/fullnodes.json'")
+    _write_lines(lines)
 
     # Write JSON to file
-    with open("generated_configs/fullnodes.json", "w") as f:
-        f.write(fullnodes_json)
+    _write_json(fullnodes, "generated_configs/fullnodes.json")
 
 
-def export_bridge_variables(bridges: List[Dict[str, Any]], authority: str) -> None:
-    """Export bridge configuration as shell environment variables."""
-    print("# Bridge configuration variables")
-    print(f"export SUI_BRIDGES_COUNT={len(bridges)}")
-    print(f"export SUI_VALIDATOR='{authority}'")
+def _bridge_export_lines(bridges: List[Dict[str, Any]], authority: str) -> List[str]:
+    """Write bridges.json and return the bridge shell export lines."""
+    lines = [
+        "# Bridge configuration variables",
+        f"export SUI_BRIDGES_COUNT={len(bridges)}",
+        f"export SUI_VALIDATOR='{authority}'",
+    ]
 
     for i, bridge in enumerate(bridges):
         alias = bridge["alias"]
@@ -1608,23 +1492,32 @@ def export_bridge_variables(bridges: List[Dict[str, Any]], authority: str) -> No
         alerts = bridge.get("alerts", get_default_alerts())
 
         # Export individual bridge variables
-        print(f"export SUI_BRIDGE_{i}_ALIAS='{alias}'")
-        print(f"export SUI_BRIDGE_{i}_TARGET='{target}'")
-        print(f"export SUI_BRIDGE_{i}_PUBLIC_ADDRESS='{public_address}'")
+        lines.extend(
+            (
+                f"export SUI_BRIDGE_{i}_ALIAS='{alias}'",
+                f"export SUI_BRIDGE_{i}_TARGET='{target}'",
+                f"export SUI_BRIDGE_{i}_PUBLIC_ADDRESS='{public_address}'",
+            )
+        )
 
         # Export alert flags as individual variables
-        for alert_type, enabled in alerts.items():
-            print(
-                f"export SUI_BRIDGE_{i}_ALERT_{alert_type.upper()}='{str(enabled).lower()}'"
-            )
+        lines.extend(
+            f"export SUI_BRIDGE_{i}_ALERT_{BRIDGE_ALERT_ENV_NAMES[alert_type]}='{str(enabled).lower()}'"
+            for alert_type, enabled in alerts.items()
+        )
 
     # Export as JSON for complex parsing - write to separate file to avoid shell parsing issues
-    bridges_json = json.dumps(bridges, indent=2)
-    print(f"export SUI_BRIDGES_CONFIG_FILE='generated_configs/bridges.json'")
+    lines.append(f"export SUI_BRIDGES_CONFIG_FILE='generated_configs/bridges.json'")
 
     # Write JSON to file
-    with open("generated_configs/bridges.json", "w") as f:
-        f.write(bridges_json)
+    _write_json(bridges, "generated_configs/bridges.json")
+
+    return lines
+
+
+def export_bridge_variables(bridges: List[Dict[str, Any]], authority: str) -> None:
+    """Export bridge configuration as shell environment variables."""
+    _write_lines(_bridge_export_lines(bridges, authority))
 
 
 def main():
@@ -1668,11 +1561,27 @@ def main():
         # Fall back to old format for backwards compatibility
         authority = config.get("sui", {}).get("validator", "")
 
-    # Generate Prometheus configuration
-    generate_prometheus_config(bridges, validators, fullnodes, prometheus_file)
+    # JSON sidecars and the Alertmanager config are written here
+    os.makedirs("generated_configs", exist_ok=True)
+
+    # prometheus.yml and bridges.json are independent, so write them concurrently.
+    # Prometheus generation is skipped when the inputs are unchanged.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        prometheus_future = executor.submit(
+            generate_prometheus_config,
+            bridges,
+            validators,
+            fullnodes,
+            prometheus_file,
+            input_digest=_config_digest(config_file),
+        )
+        bridge_lines_future = executor.submit(_bridge_export_lines, bridges, authority)
+        prometheus_future.result()
+        bridge_lines = bridge_lines_future.result()
 
-    # Generate bridge-specific alert rules
-    generate_alert_rules(bridges, alert_rules_dir)
+    # Generate bridge-specific alert rules if bridges are configured
+    if bridges:
+        generate_alert_rules(bridges, alert_rules_dir)
 
     # Generate validator-specific alert rules if validators are configured
     if validators:
@@ -1686,8 +1595,8 @@ def main():
     alertmanager_file = "generated_configs/alertmanager.yml"
     generate_alertmanager_config(config, alertmanager_file)
 
-    # Export bridge variables
-    export_bridge_variables(bridges, authority)
+    # Export bridge variables (bridges.json was written above)
+    _write_lines(bridge_lines)
 
     # Export validator variables if configured
     if validators: